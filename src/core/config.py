@@ -18,11 +18,53 @@ RECENTS_FILE = os.path.expanduser("~/.config/code-launcher/recents.json")
 LOCK_FILE = os.path.expanduser("~/.config/code-launcher/launcher.lock")
 PID_FILE = os.path.expanduser("~/.config/code-launcher/launcher.pid")
 
+class RevisionCache:
+    """
+    Cache of values derived from dictionaries loaded by ConfigManager
+
+    An entry is reused while the source is the same object with the same size
+    and the config revision is unchanged. In-place edits of loaded categories,
+    projects or files are always followed by a save, which bumps the revision.
+    """
+
+    def __init__(self, max_entries=8):
+        self._entries = {}
+        self._max_entries = max_entries
+
+    def get(self, source, config, build):
+        """
+        Return the cached value for source, building it when stale
+
+        Args:
+            source: Dictionary the value is derived from
+            config: ConfigManager whose revision tracks saved changes (optional)
+            build: Callable building the value from source
+
+        Returns:
+            The value returned by build(source)
+        """
+        revision = getattr(config, 'revision', None)
+        cached = self._entries.get(id(source))
+        if cached and cached[0] is source and cached[1] == len(source) and cached[2] == revision:
+            return cached[3]
+
+        value = build(source)
+        if len(self._entries) >= self._max_entries:
+            self._entries.clear()
+        self._entries[id(source)] = (source, len(source), revision, value)
+        return value
+
 class ConfigManager:
     """Manages all launcher configuration"""
 
     def __init__(self):
         self._ensure_config_dir()
+        # Bumped whenever categories, projects or files are saved so indexes
+        # built from the in-memory data know when to rebuild
+        self.revision = 0
+        # Bumped whenever favorites are saved; kept apart from revision so a
+        # favorite toggle doesn't invalidate the data indexes
+        self.favorites_revision = 0
 
     def _ensure_config_dir(self):
         """Ensure configuration directory exists"""
@@ -46,6 +88,7 @@ class ConfigManager:
 
     def save_categories(self, categories):
         """Save categories"""
+        self.revision += 1
         with open(CATEGORIES_FILE, 'w') as f:
             json.dump(categories, f, indent=2)
 
@@ -61,6 +104,7 @@ class ConfigManager:
 
     def save_projects(self, projects):
         """Save projects"""
+        self.revision += 1
         with open(PROJECTS_FILE, 'w') as f:
             json.dump(projects, f, indent=2)
 
@@ -76,6 +120,7 @@ class ConfigManager:
 
     def save_files(self, files):
         """Save files"""
+        self.revision += 1
         with open(FILES_FILE, 'w') as f:
             json.dump(files, f, indent=2)
 
@@ -211,6 +256,7 @@ class ConfigManager:
 
     def save_favorites(self, favorites):
         """Save favorites"""
+        self.favorites_revision += 1
         with open(FAVORITES_FILE, 'w') as f:
             json.dump(favorites, f, indent=2)
 
@@ -225,6 +271,21 @@ class ConfigManager:
             key = "projects"
         return item_path in favorites.get(key, [])
 
+    def get_favorites_set(self):
+        """
+        Snapshot all favorites for fast membership checks
+
+        Returns:
+            frozenset of (item_path, item_type) pairs, item_type being
+            "category", "file" or "project"
+        """
+        favorites = self.load_favorites()
+        return frozenset(
+            (item_path, item_type)
+            for key, item_type in (("categories", "category"), ("files", "file"), ("projects", "project"))
+            for item_path in favorites.get(key, [])
+        )
+
     def toggle_favorite(self, item_path, item_type="project"):
         """Toggle favorite status of an item"""
         favorites = self.load_favorites()
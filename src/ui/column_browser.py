@@ -5,9 +5,226 @@ Finder-style column browser module
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Pango, GLib
+from gi.repository import Gdk, Gtk, Pango, GLib
+import logging
 import os
+import sys
+from bisect import bisect_right
+from itertools import count, islice
+from operator import itemgetter
 from src.context_menu.handler import ContextMenuHandler
+from src.core.config import RevisionCache
+from utils.text_editor_utils import open_file_in_editor
+
+logger = logging.getLogger(__name__)
+
+# GObject enum values and drop targets resolved once at import time
+_ELLIPSIZE_END = Pango.EllipsizeMode.END
+_POLICY_NEVER = Gtk.PolicyType.NEVER
+_POLICY_AUTO = Gtk.PolicyType.AUTOMATIC
+_SHADOW_IN = Gtk.ShadowType.IN
+_SIZING_FIXED = Gtk.TreeViewColumnSizing.FIXED
+_TARGETS = [Gtk.TargetEntry.new("text/uri-list", 0, 0)]
+
+# Store column indices passed to insert_with_valuesv for a full row
+_STORE_COLUMNS = [0, 1, 2, 3, 4, 5]
+
+# Rows inserted per main-loop iteration when populating large columns
+_POPULATE_CHUNK = 200
+
+# Stamps for ColumnBrowser.content_version, unique across all columns
+_content_versions = count()
+
+# Hierarchy path syntax: "cat:Web:Frontend", "projects:cat:Web"
+_SEP = ":"
+_CAT_PREFIX = "cat:"
+_PROJ_PREFIX = "projects:"
+_ROOT_PATH = sys.intern("categories")
+
+# Icon names written into every row, shared so each row reuses one str object
+_ICON_FOLDER = sys.intern("folder")
+_ICON_CODE = sys.intern("code")
+_ICON_FILE = sys.intern("text-x-generic")
+
+# Position of each item kind in hierarchy columns (subcategories, projects, files)
+_GROUP_ORDER = {"category": 0, "project": 1, "file": 2}
+
+# Category indexes of the projects/files dicts they were built from
+_category_index_cache = RevisionCache()
+
+
+def _parse_hierarchy_path(path):
+    """
+    Split a column path into its hierarchy components
+
+    Args:
+        path: Column path (e.g., "categories", "cat:Web:Frontend", "projects:cat:Web")
+
+    Returns:
+        Tuple of (kind, category, subcategory_path, parts) where parts holds
+        the category names after the "cat:" prefix
+    """
+    if not path or path == _ROOT_PATH:
+        return ("root", None, None, ())
+
+    if path.startswith(_CAT_PREFIX):
+        kind = "cat"
+        rest = path[len(_CAT_PREFIX):]
+    elif path.startswith(_PROJ_PREFIX):
+        # Projects view wraps a category path (e.g., "projects:cat:Web")
+        kind = "projects"
+        if not path.startswith(_CAT_PREFIX, len(_PROJ_PREFIX)):
+            return (kind, None, None, ())
+        rest = path[len(_PROJ_PREFIX) + len(_CAT_PREFIX):]
+    else:
+        return (path.partition(_SEP)[0], None, None, ())
+
+    category, sep, subcategory_path = rest.partition(_SEP)
+    if not sep:
+        # Single level: no need to split
+        return (kind, category, None, (category,))
+
+    return (kind, category, subcategory_path, tuple(rest.split(_SEP)))
+
+
+def _index_by_category(items, config=None):
+    """
+    Group projects or files by category
+
+    Args:
+        items: Projects or files dictionary (name -> path or info dict)
+        config: ConfigManager whose revision tracks saved changes (optional)
+
+    Returns:
+        Dictionary mapping category name (None for root) to a list of
+        (name, path, subcategory) tuples
+    """
+    return _category_index_cache.get(items, config, _build_category_index)
+
+
+def _build_category_index(items):
+    """Build the category index returned by _index_by_category"""
+    index = {}
+    for name, info in items.items():
+        if isinstance(info, str):
+            index.setdefault(None, []).append((name, info, None))
+        else:
+            category = info.get("category", None) or None
+            index.setdefault(category, []).append((name, info.get("path", ""), info.get("subcategory", None)))
+    return index
+
+
+def _level_filter(category_name, subcategory_path):
+    """
+    Build the predicate picking the items listed at a hierarchy level
+
+    Args:
+        category_name: Category of the level (None for the root level)
+        subcategory_path: Subcategory path below the category (None for the category itself)
+
+    Returns:
+        Callable taking an item's subcategory and returning True if it belongs
+    """
+    if not category_name:
+        # Root level: items without category, already picked by the index
+        return lambda item_subcategory: True
+
+    if subcategory_path:
+        # Item subcategory must match the current path or sit below it
+        sub_prefix = subcategory_path + _SEP
+        return lambda item_subcategory: bool(item_subcategory) and (
+            item_subcategory == subcategory_path or item_subcategory.startswith(sub_prefix))
+
+    # No subcategory selected: only items without subcategory
+    return lambda item_subcategory: not item_subcategory
+
+
+def classify_item(item_path, icon_name):
+    """
+    Classify a column item from its path and icon
+
+    Args:
+        item_path: Item path ("cat:..." for categories)
+        icon_name: Icon name stored in the row
+
+    Returns:
+        "category", "file" or "project"
+    """
+    if item_path.startswith(_CAT_PREFIX):
+        return "category"
+    if icon_name == _ICON_FILE:
+        return "file"
+    return "project"
+
+
+def _favorite_sort_key(item_path, icon_name, is_favorite, display_name):
+    """
+    Sort key of a row in hierarchy columns
+
+    Returns:
+        Tuple of (group, not is_favorite, casefolded name): subcategories, then
+        projects, then files, each favorites first and then alphabetical
+    """
+    return (_GROUP_ORDER[classify_item(item_path, icon_name)], not is_favorite, display_name.casefold())
+
+
+class _RowSortKeys:
+    """Read-only sequence of a store's row sort keys, skipping one row, for bisect"""
+
+    def __init__(self, store, skip_index):
+        self._store = store
+        self._skip_index = skip_index
+
+    def __len__(self):
+        return self._store.iter_n_children(None) - 1
+
+    def __getitem__(self, index):
+        if index >= self._skip_index:
+            index += 1
+        store = self._store
+        iter = store.iter_nth_child(None, index)
+        return _favorite_sort_key(store.get_value(iter, 1), store.get_value(iter, 3),
+                                  store.get_value(iter, 4), store.get_value(iter, 0))
+
+
+def path_from_dropped_uri(uri):
+    """
+    Convert one entry of a dropped text/uri-list to a local path
+
+    Args:
+        uri: URI received in the drag data
+
+    Returns:
+        Local filesystem path, or None for non-file and malformed URIs
+    """
+    if not uri.startswith('file://'):
+        return None
+
+    # Strip the scheme and decode URL encoding in one native call
+    try:
+        path, _hostname = GLib.filename_from_uri(uri)
+    except GLib.Error as e:
+        logger.warning(f"Skipping invalid dropped URI {uri}: {e}")
+        return None
+    return path
+
+
+def _sorted_rows(keyed_rows):
+    """
+    Sort (sort_key, row) pairs on their precomputed key and drop the key
+
+    Keys are built once per item (e.g. (not is_fav, name.casefold())), so the
+    sort itself runs without Python-level key callbacks.
+
+    Args:
+        keyed_rows: List of (sort_key, row) tuples, sorted in place
+
+    Returns:
+        List of rows in sorted order
+    """
+    keyed_rows.sort(key=itemgetter(0))
+    return [row for _, row in keyed_rows]
+
 
 class ColumnBrowser(Gtk.ScrolledWindow):
     """Finder-style individual column widget"""
@@ -15,13 +232,17 @@ class ColumnBrowser(Gtk.ScrolledWindow):
         super().__init__()
         self.callback = callback
         self.parent_window = parent_window  # Reference to main window
+        self._parsed = None  # Cached _parse_hierarchy_path() result for current_path
+        self._path_to_row = {}  # Item path -> row index, rebuilt by _populate
+        self.content_version = next(_content_versions)  # Restamped whenever rows are loaded or appended
+        self._populate_source = None  # Idle source inserting the remaining rows
         self.current_path = None
         self.column_type = column_type  # "directory", "categories", "projects"
         self.context_menu_active = False  # Track if context menu is open
 
-        self.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.set_policy(_POLICY_NEVER, _POLICY_AUTO)
         self.set_min_content_width(200)
-        self.set_shadow_type(Gtk.ShadowType.IN)
+        self.set_shadow_type(_SHADOW_IN)
 
         # Item list - added favorite flag and breadcrumb flag
         self.store = Gtk.ListStore(str, str, bool, str, bool, bool)  # display_name, full_path, is_dir, icon_name, is_favorite, is_in_breadcrumb
@@ -39,17 +260,23 @@ class ColumnBrowser(Gtk.ScrolledWindow):
 
         # Text renderer
         text_renderer = Gtk.CellRendererText()
-        text_renderer.set_property("ellipsize", Pango.EllipsizeMode.END)
+        text_renderer.set_property("ellipsize", _ELLIPSIZE_END)
         column.pack_start(text_renderer, True)
         column.set_cell_data_func(text_renderer, self.text_data_func)
 
+        # Rows are all one line high and the column just fills the view, so
+        # let GTK skip measuring every row on insert
+        column.set_sizing(_SIZING_FIXED)
+        column.set_expand(True)
         self.treeview.append_column(column)
+        self.treeview.set_fixed_height_mode(True)
 
         # Selection
-        selection = self.treeview.get_selection()
-        selection.connect("changed", self.on_selection_changed)
+        self.selection = self.treeview.get_selection()  # Stable for the view's lifetime
+        self.selection.connect("changed", self.on_selection_changed)
 
-        # Clear selection when losing focus
+        # Track the focused column on the window and clear selection when losing focus
+        self.treeview.connect("focus-in-event", self.on_focus_in)
         self.treeview.connect("focus-out-event", self.on_focus_out)
 
         # Setup drag and drop for this column
@@ -58,14 +285,51 @@ class ColumnBrowser(Gtk.ScrolledWindow):
         # Double click
         self.treeview.connect("row-activated", self.on_row_activated)
 
-        # Context menu setup
-        self.context_menu_handler = None
+        # Context menu setup (handler is created on first right-click)
+        self._context_menu_handler = None
         if parent_window:
-            self.context_menu_handler = ContextMenuHandler(self, parent_window)
-            self.treeview.connect("button-press-event", self.context_menu_handler.on_button_press)
+            self.treeview.connect("button-press-event", self._on_button_press)
 
+        # Children are shown here so packing code only needs column.show()
+        self.treeview.show()
         self.add(self.treeview)
 
+        # Queued chunks hold a reference to the column, stop them with it
+        self.connect("destroy", self._on_destroy)
+
+    def _on_destroy(self, widget):
+        """Cancel any rows still queued for idle insertion"""
+        self.cancel_populate()
+
+    @property
+    def context_menu_handler(self):
+        """ContextMenuHandler for this column, created on first use (None without a parent window)"""
+        if self._context_menu_handler is None and self.parent_window:
+            self._context_menu_handler = ContextMenuHandler(self, self.parent_window)
+        return self._context_menu_handler
+
+    def _on_button_press(self, widget, event):
+        """Forward button presses to the context menu handler once a right-click needs it"""
+        if self._context_menu_handler is None and event.button != 3:
+            return False
+        return self.context_menu_handler.on_button_press(widget, event)
+
+    @property
+    def current_path(self):
+        """Path of the content currently loaded in this column"""
+        return self._current_path
+
+    @current_path.setter
+    def current_path(self, value):
+        self._current_path = value
+        self._parsed = None
+
+    def _parse_path(self):
+        """Return the (kind, category, subcategory_path, parts) tuple for current_path"""
+        if self._parsed is None:
+            self._parsed = _parse_hierarchy_path(self._current_path)
+        return self._parsed
+
     def icon_data_func(self, column, cell, model, iter, data):
         """Assign icon based on type"""
         icon_name = model.get_value(iter, 3)
@@ -118,35 +382,107 @@ class ColumnBrowser(Gtk.ScrolledWindow):
                             self.treeview.grab_focus()
 
                         # Save the selection
-                        tree_path = model.get_path(iter)
-                        self.parent_window.keyboard_handler.column_selections[i] = tree_path
+                        self.parent_window.keyboard_handler.column_selections[i] = path
 
                         # Update breadcrumb trail after a short delay to ensure focus is set
-                        from gi.repository import GLib
                         GLib.idle_add(self.parent_window.keyboard_handler._update_breadcrumb_trail)
                         break
                         GLib.idle_add(self.parent_window.keyboard_handler._update_breadcrumb_trail)
                         break
 
+    def on_focus_in(self, widget, event):
+        """Record this column as the window's focused column"""
+        if self.parent_window:
+            self.parent_window.focused_column = self
+        return False  # Allow event to propagate
+
     def on_focus_out(self, widget, event):
         """Clear selection when column loses focus (but not when context menu is active)"""
+        if self.parent_window and getattr(self.parent_window, 'focused_column', None) is self:
+            self.parent_window.focused_column = None
+
         # Don't clear selection if context menu is open
         if self.context_menu_active:
             return False
 
-        selection = self.treeview.get_selection()
+        selection = self.selection
         selection.unselect_all()
         return False  # Allow event to propagate
 
     def mark_breadcrumb_item(self, path):
         """Mark an item as part of the breadcrumb trail"""
-        iter = self.store.get_iter_first()
+        iter = self.find_item_iter(path)
+        if iter:
+            self.store.set_value(iter, 5, True)  # Set breadcrumb flag
+
+    def find_item_iter(self, path):
+        """
+        Find the row holding an item path
+
+        Args:
+            path: Item path (store column 1)
+
+        Returns:
+            Gtk.TreeIter of the first matching row, or None
+        """
+        store = self.store
+        index = self._path_to_row.get(path)
+        if index is not None:
+            iter = store.iter_nth_child(None, index)
+            if iter and store.get_value(iter, 1) == path:
+                return iter
+
+        # Rows changed outside _populate - fall back to a scan
+        iter = store.get_iter_first()
         while iter:
-            item_path = self.store.get_value(iter, 1)
-            if item_path == path:
-                self.store.set_value(iter, 5, True)  # Set breadcrumb flag
-                break
-            iter = self.store.iter_next(iter)
+            if store.get_value(iter, 1) == path:
+                return iter
+            iter = store.iter_next(iter)
+        return None
+
+    def set_item_favorite(self, iter, is_favorite):
+        """
+        Update one row's favorite flag in place
+
+        Hierarchy columns list favorites first within each group
+        (subcategories, projects, files), so the row is moved to its sorted
+        slot, found by bisecting the already sorted rows, instead of reloading
+        the whole column.
+
+        Args:
+            iter: Gtk.TreeIter of the row
+            is_favorite: New favorite status
+        """
+        store = self.store
+        store.set_value(iter, 4, is_favorite)
+
+        # Search results, recents and directories aren't ordered by favorites
+        if self._parse_path()[0] not in ("root", "cat", "projects"):
+            return
+
+        # Rows still queued by _populate can't be compared against yet, so the
+        # row keeps its place until the column is next loaded
+        if self._populate_source is not None:
+            return
+
+        row_index = store.get_path(iter).get_indices()[0]
+        key = _favorite_sort_key(store.get_value(iter, 1), store.get_value(iter, 3),
+                                 is_favorite, store.get_value(iter, 0))
+        new_index = bisect_right(_RowSortKeys(store, row_index), key)
+        if new_index != row_index:
+            # Insert before the row now at new_index once this one is taken out
+            anchor = store.iter_nth_child(None, new_index if new_index < row_index else new_index + 1)
+            store.move_before(iter, anchor)
+
+            # Only the rows between the old and new slot changed index
+            path_to_row = self._path_to_row
+            first, last = sorted((row_index, new_index))
+            row = store.iter_nth_child(None, first)
+            for index in range(first, last + 1):
+                path_to_row[store.get_value(row, 1)] = index
+                row = store.iter_next(row)
+
+        self.treeview.scroll_to_cell(store.get_path(iter), None, False, 0, 0)
 
     def clear_breadcrumb_trail(self):
         """Clear all breadcrumb markings in this column"""
@@ -163,7 +499,7 @@ class ColumnBrowser(Gtk.ScrolledWindow):
         item_icon = model.get_value(iter, 3)
 
         # If it's a category (starts with "cat:"), navigate to it
-        if full_path and full_path.startswith("cat:"):
+        if full_path and full_path.startswith(_CAT_PREFIX):
             # Exit search mode and navigate to category
             if self.parent_window:
                 # Clear search
@@ -176,11 +512,10 @@ class ColumnBrowser(Gtk.ScrolledWindow):
                 # Navigate to selected category
                 # Use GLib.idle_add to ensure interface reloaded first
                 GLib.idle_add(self._navigate_to_category, full_path)
-        elif item_icon == "text-x-generic":
+        elif item_icon == _ICON_FILE:
             # It's a file - open with text editor
             if self.parent_window:
-                from utils.text_editor_utils import open_file_in_editor
-                text_editor = getattr(self.parent_window, 'default_text_editor', 'gnome-text-editor')
+                text_editor = self.parent_window.default_text_editor
                 success = open_file_in_editor(full_path, text_editor)
 
                 if success:
@@ -194,7 +529,7 @@ class ColumnBrowser(Gtk.ScrolledWindow):
         else:
             # It's a project - open with default editor
             if self.parent_window:
-                default_editor = getattr(self.parent_window, 'default_editor', 'kiro')
+                default_editor = self.parent_window.default_editor
                 if default_editor == "vscode":
                     self.parent_window.open_vscode_project(full_path)
                 else:
@@ -207,39 +542,32 @@ class ColumnBrowser(Gtk.ScrolledWindow):
         Args:
             category_path: Category path (e.g., "cat:Web:Frontend")
         """
-        # Parse category path
-        parts = category_path.split(":")[1:]  # Remove "cat:" prefix
-
-        if not parts:
+        if not category_path.startswith(_CAT_PREFIX):
             return False
 
-        # Navigate level by level
-        current_path = None
-        for i, part in enumerate(parts):
-            if i == 0:
-                # First level - select in first column
-                current_path = f"cat:{part}"
-            else:
-                # Nested levels
-                current_path = f"{current_path}:{part}"
+        # Navigate level by level through the "cat:Web", "cat:Web:Frontend", ...
+        # prefixes of the path, found by scanning for separators
+        end = len(_CAT_PREFIX) - 1
+        i = 0
+        while end != -1:
+            end = category_path.find(_SEP, end + 1)
+            current_path = category_path if end == -1 else category_path[:end]
 
             # Find corresponding column
             if i < len(self.parent_window.columns):
                 column = self.parent_window.columns[i]
 
                 # Find item in column
-                iter = column.store.get_iter_first()
-                while iter:
-                    item_path = column.store.get_value(iter, 1)
-                    if item_path == current_path:
-                        # Select this item
-                        selection = column.treeview.get_selection()
-                        selection.select_iter(iter)
-
-                        # Trigger selection event
-                        self.parent_window.navigation_manager.on_column_selection(current_path, True, None)
-                        break
-                    iter = column.store.iter_next(iter)
+                iter = column.find_item_iter(current_path)
+                if iter:
+                    # Select this item
+                    selection = column.selection
+                    selection.select_iter(iter)
+
+                    # Trigger selection event
+                    self.parent_window.navigation_manager.on_column_selection(current_path, True, None)
+
+            i += 1
 
         return False
 
@@ -247,126 +575,102 @@ class ColumnBrowser(Gtk.ScrolledWindow):
 
     def load_directory(self, path):
         """Load directory contents - only show directories"""
-        self.store.clear()
+        self.clear_items()
         self.current_path = path
 
         if not path or not os.path.exists(path):
+            self._populate([])
             return
 
+        rows = []
         try:
-            items = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-
-                # Skip hidden files
-                if item.startswith('.'):
-                    continue
-
-                # Only show directories
-                if not os.path.isdir(item_path):
-                    continue
-
-                items.append((item, item_path))
+            # scandir reuses the dirent type from the directory read, so
+            # is_dir() only needs a stat for symlinks
+            with os.scandir(path) as entries:
+                # Skip hidden entries and only show directories
+                keyed_rows = []
+                for entry in entries:
+                    name = entry.name
+                    if name[:1] == '.' or not entry.is_dir():
+                        continue
+                    keyed_rows.append((name.casefold(), (name, entry.path, True, _ICON_FOLDER, False, False)))
 
             # Sort alphabetically
-            items.sort(key=lambda x: x[0].lower())
-
-            for display_name, full_path in items:
-                self.store.append([display_name, full_path, True, "folder", False, False])
+            rows = _sorted_rows(keyed_rows)
 
         except PermissionError:
             pass
 
+        self._populate(rows)
+
     def load_categories(self, categories):
         """Load only main categories in column"""
-        self.store.clear()
-        self.current_path = "categories"
+        self.clear_items()
+        self.current_path = _ROOT_PATH
 
-        # Sort categories alphabetically
-        sorted_categories = sorted(categories.items(), key=lambda x: x[0].lower())
+        keyed_rows = []
+        for category_name, category_info in categories.items():
+            icon_name = category_info.get("icon", _ICON_FOLDER)
+            row = (category_name, f"category:{category_name}", True, icon_name, False, False)
+            keyed_rows.append((category_name.casefold(), row))
 
-        for category_name, category_info in sorted_categories:
-            icon_name = category_info.get("icon", "folder")
-            self.store.append([category_name, f"category:{category_name}", True, icon_name, False, False])
+        # Sort categories alphabetically
+        self._populate(_sorted_rows(keyed_rows))
 
     def load_hierarchy_level(self, categories, hierarchy_path=None, projects=None, files=None):
         """Load a specific level of the hierarchy, including root-level projects and files"""
-        self.store.clear()
+        self.clear_items()
 
         if projects is None:
             projects = {}
         if files is None:
             files = {}
 
+        self.current_path = hierarchy_path or _ROOT_PATH
+
         # Get config for checking favorites
         config = self.parent_window.config if self.parent_window else None
 
+        rows = []
         if hierarchy_path is None:
             # Root level: show main categories, plus root-level projects and files
-            self.current_path = "categories"
 
             # Collect categories with favorite status
             categories_list = []
             for category_name, category_info in categories.items():
-                icon_name = category_info.get("icon", "folder")
-                cat_path = f"cat:{category_name}"
+                icon_name = category_info.get("icon", _ICON_FOLDER)
+                cat_path = f"{_CAT_PREFIX}{category_name}"
                 is_fav = config.is_favorite(cat_path, "category") if config else False
-                categories_list.append((category_name, cat_path, icon_name, is_fav))
-
-            # Sort: favorites first, then alphabetically
-            categories_list.sort(key=lambda x: (not x[3], x[0].lower()))
-
-            # Add categories
-            for category_name, cat_path, icon_name, is_fav in categories_list:
-                self.store.append([category_name, cat_path, True, icon_name, is_fav, False])
-
-            # Collect root-level projects
-            root_projects = []
-            for project_name, project_info in projects.items():
-                if isinstance(project_info, str):
-                    root_projects.append((project_name, project_info))
-                elif isinstance(project_info, dict):
-                    if "category" not in project_info or project_info.get("category") is None:
-                        root_projects.append((project_name, project_info.get("path", "")))
-
-            # Sort projects: favorites first, then alphabetically
-            root_projects_with_fav = []
-            for project_name, project_path in root_projects:
-                is_fav = config.is_favorite(project_path, "project") if config else False
-                root_projects_with_fav.append((project_name, project_path, is_fav))
-            root_projects_with_fav.sort(key=lambda x: (not x[2], x[0].lower()))
-
-            # Add root projects
-            for project_name, project_path, is_fav in root_projects_with_fav:
-                self.store.append([project_name, project_path, True, "code", is_fav, False])
-
-            # Collect root-level files
-            root_files = []
-            for file_name, file_info in files.items():
-                if isinstance(file_info, str):
-                    root_files.append((file_name, file_info))
-                elif isinstance(file_info, dict):
-                    if "category" not in file_info or file_info.get("category") is None:
-                        root_files.append((file_name, file_info.get("path", "")))
-
-            # Sort files: favorites first, then alphabetically
-            root_files_with_fav = []
-            for file_name, file_path in root_files:
-                is_fav = config.is_favorite(file_path, "file") if config else False
-                root_files_with_fav.append((file_name, file_path, is_fav))
-            root_files_with_fav.sort(key=lambda x: (not x[2], x[0].lower()))
-
-            # Add root files
-            for file_name, file_path, is_fav in root_files_with_fav:
-                self.store.append([file_name, file_path, True, "text-x-generic", is_fav, False])
+                row = (category_name, cat_path, True, icon_name, is_fav, False)
+                categories_list.append(((not is_fav, category_name.casefold()), row))
+
+            # Add categories: favorites first, then alphabetically
+            rows.extend(_sorted_rows(categories_list))
+
+            # Add root-level projects, then files (from the per-category index):
+            # favorites first, then alphabetically
+            for items, icon_name, item_type in ((projects, _ICON_CODE, "project"),
+                                                (files, _ICON_FILE, "file")):
+                root_items = []
+                for item_name, item_path, _ in _index_by_category(items, config).get(None, ()):
+                    # The root bucket also holds items with an empty category
+                    # string; only the projects and mixed views list those
+                    info = items[item_name]
+                    if not isinstance(info, str) and info.get("category") is not None:
+                        continue
+                    is_fav = config.is_favorite(item_path, item_type) if config else False
+                    row = (item_name, item_path, True, icon_name, is_fav, False)
+                    root_items.append(((not is_fav, item_name.casefold()), row))
+                rows.extend(_sorted_rows(root_items))
         else:
-            # Nested level: parse path
-            parts = hierarchy_path.split(":")[1:]  # Ignore first "cat"
+            # Nested level: parse path (only category paths have levels)
+            kind, _, _, parts = self._parse_path()
+            if kind != "cat":
+                parts = ()
 
             if len(parts) == 1:
                 # Second level: subcategories of main category
                 category_name = parts[0]
-                self.current_path = f"cat:{category_name}"
 
                 if category_name in categories:
                     cat_info = categories[category_name]
@@ -375,113 +679,74 @@ class ColumnBrowser(Gtk.ScrolledWindow):
                     subcategories = cat_info.get("subcategories", {})
                     subcats_list = []
                     for sub_name, sub_info in subcategories.items():
-                        sub_icon = sub_info.get("icon", "folder")
-                        sub_path = f"cat:{category_name}:{sub_name}"
+                        sub_icon = sub_info.get("icon", _ICON_FOLDER)
+                        sub_path = f"{hierarchy_path}{_SEP}{sub_name}"
                         is_fav = config.is_favorite(sub_path, "category") if config else False
-                        subcats_list.append((sub_name, sub_path, sub_icon, is_fav))
+                        row = (sub_name, sub_path, True, sub_icon, is_fav, False)
+                        subcats_list.append(((not is_fav, sub_name.casefold()), row))
 
                     # Sort: favorites first, then alphabetically
-                    subcats_list.sort(key=lambda x: (not x[3], x[0].lower()))
-
-                    for sub_name, sub_path, sub_icon, is_fav in subcats_list:
-                        self.store.append([sub_name, sub_path, True, sub_icon, is_fav, False])
-            else:
-                # Deeper levels: nested subcategories
+                    rows.extend(_sorted_rows(subcats_list))
+            elif parts:
+                # Deeper levels: walk nested subcategories colon by colon
                 current_categories = categories
-                for i, part in enumerate(parts):
-                    if i < len(parts) - 1:  # Not the last element
-                        if part in current_categories:
-                            current_categories = current_categories[part].get("subcategories", {})
-                        else:
-                            current_categories = {}
-                            break
-                    else:  # Last element
-                        if part in current_categories:
-                            subcat_info = current_categories[part]
-                            subcategories = subcat_info.get("subcategories", {})
-
-                            subcats_list = []
-                            for sub_name, sub_info in subcategories.items():
-                                sub_icon = sub_info.get("icon", "folder")
-                                full_path = f"cat:{':'.join(parts)}:{sub_name}"
-                                is_fav = config.is_favorite(full_path, "category") if config else False
-                                subcats_list.append((sub_name, full_path, sub_icon, is_fav))
-
-                            # Sort: favorites first, then alphabetically
-                            subcats_list.sort(key=lambda x: (not x[3], x[0].lower()))
-
-                            for sub_name, full_path, sub_icon, is_fav in subcats_list:
-                                self.store.append([sub_name, full_path, True, sub_icon, is_fav, False])
-
-        self.current_path = hierarchy_path or "categories"
+                pos = len(_CAT_PREFIX)
+                nxt = hierarchy_path.find(_SEP, pos)
+                while nxt != -1 and current_categories:
+                    part_info = current_categories.get(hierarchy_path[pos:nxt])
+                    current_categories = part_info.get("subcategories", {}) if part_info else {}
+                    pos = nxt + 1
+                    nxt = hierarchy_path.find(_SEP, pos)
+
+                # Last element
+                subcat_info = current_categories.get(hierarchy_path[pos:])
+                if subcat_info is not None:
+                    subcategories = subcat_info.get("subcategories", {})
+
+                    subcats_list = []
+                    for sub_name, sub_info in subcategories.items():
+                        sub_icon = sub_info.get("icon", _ICON_FOLDER)
+                        full_path = f"{hierarchy_path}{_SEP}{sub_name}"
+                        is_fav = config.is_favorite(full_path, "category") if config else False
+                        row = (sub_name, full_path, True, sub_icon, is_fav, False)
+                        subcats_list.append(((not is_fav, sub_name.casefold()), row))
+
+                    # Sort: favorites first, then alphabetically
+                    rows.extend(_sorted_rows(subcats_list))
+
+        self._populate(rows)
 
     def load_projects_at_level(self, hierarchy_path, projects):
         """Load projects corresponding to current hierarchy level"""
-        self.store.clear()
-        self.current_path = f"projects:{hierarchy_path}"
+        self.clear_items()
+        self.current_path = f"{_PROJ_PREFIX}{hierarchy_path}"
 
         # Get config for checking favorites
         config = self.parent_window.config if self.parent_window else None
 
-        # Parse hierarchy path
-        if not hierarchy_path or hierarchy_path == "categories":
-            # Projects without category (root)
-            category_name = None
-            subcategory_path = None
-        else:
-            parts = hierarchy_path.split(":")[1:]  # Ignore first "cat"
-            if len(parts) == 1:
-                category_name = parts[0]
-                subcategory_path = None
-            else:
-                category_name = parts[0]
-                subcategory_path = ":".join(parts[1:])
-
-        # Filter projects
-        category_projects = []
-        for project_name, project_info in projects.items():
-            if isinstance(project_info, str):
-                project_path = project_info
-                project_category = None
-                project_subcategory = None
-            else:
-                project_path = project_info.get("path", "")
-                project_category = project_info.get("category", None)
-                project_subcategory = project_info.get("subcategory", None)
-
-            # Filter by hierarchy
-            if category_name:
-                if project_category == category_name:
-                    if subcategory_path:
-                        # Check if project subcategory matches current path
-                        if project_subcategory:
-                            project_sub_path = project_subcategory
-                            if subcategory_path == project_sub_path or project_sub_path.startswith(subcategory_path + ":"):
-                                category_projects.append((project_name, project_path))
-                    else:
-                        # If no subcategory specified, show projects without subcategory
-                        if not project_subcategory:
-                            category_projects.append((project_name, project_path))
-            else:
-                # Show projects without category
-                if not project_category:
-                    category_projects.append((project_name, project_path))
-
-        # Add favorite status and sort: favorites first, then alphabetically
+        # Parse hierarchy path (no category means root-level projects)
+        _, category_name, subcategory_path, _ = self._parse_path()
+
+        # Pick the hierarchy filter once, outside the per-project loop
+        belongs = _level_filter(category_name, subcategory_path)
+
+        # Filter projects, only looking at the ones in this category, then add
+        # favorite status and sort: favorites first, then alphabetically
         category_projects_with_fav = []
-        for project_name, project_path in category_projects:
-            is_fav = config.is_favorite(project_path, "project") if config else False
-            category_projects_with_fav.append((project_name, project_path, is_fav))
-        category_projects_with_fav.sort(key=lambda x: (not x[2], x[0].lower()))
+        category_index = _index_by_category(projects, config)
+        for project_name, project_path, project_subcategory in category_index.get(category_name or None, ()):
+            if belongs(project_subcategory):
+                is_fav = config.is_favorite(project_path, "project") if config else False
+                row = (project_name, project_path, True, _ICON_CODE, is_fav, False)
+                category_projects_with_fav.append(((not is_fav, project_name.casefold()), row))
 
-        for project_name, project_path, is_fav in category_projects_with_fav:
-            self.store.append([project_name, project_path, True, "code", is_fav, False])
+        self._populate(_sorted_rows(category_projects_with_fav))
 
 
 
     def load_mixed_content(self, categories, hierarchy_path, projects, files=None):
         """Load subcategories, projects, and files together in same column"""
-        self.store.clear()
+        self.clear_items()
         self.current_path = hierarchy_path
 
         if files is None:
@@ -490,148 +755,143 @@ class ColumnBrowser(Gtk.ScrolledWindow):
         # Get config for checking favorites
         config = self.parent_window.config if self.parent_window else None
 
-        # Collect subcategories
-        subcategories_list = []
+        # Parse the level once; it drives both the subcategory walk and the
+        # project/file filter (no category means root level)
+        kind, category_name, subcategory_path, parts = self._parse_path()
+
+        # Collect subcategories with favorite status
+        subcategories_with_fav = []
 
-        if not hierarchy_path or hierarchy_path == "categories":
-            # Load subcategories of main categories
-            sorted_categories = sorted(categories.items(), key=lambda x: x[0].lower())
+        def add_subcategories(subcategories, prefix):
+            for sub_name, sub_info in subcategories.items():
+                sub_icon = sub_info.get("icon", _ICON_FOLDER)
+                sub_path = f"{prefix}{_SEP}{sub_name}"
+                is_fav = config.is_favorite(sub_path, "category") if config else False
+                row = (sub_name, sub_path, True, sub_icon, is_fav, False)
+                subcategories_with_fav.append(((not is_fav, sub_name.casefold()), row))
 
-            for category_name, category_info in sorted_categories:
+        if kind == "root":
+            # Load subcategories of main categories (category order breaks name ties)
+            sorted_categories = _sorted_rows([(name.casefold(), (name, info)) for name, info in categories.items()])
+
+            for cat_name, category_info in sorted_categories:
                 subcategories = category_info.get("subcategories", {})
                 if subcategories:
-                    sorted_subcats = sorted(subcategories.items(), key=lambda x: x[0].lower())
-
-                    for sub_name, sub_info in sorted_subcats:
-                        sub_icon = sub_info.get("icon", "folder")
-                        sub_path = f"cat:{category_name}:{sub_name}"
-                        subcategories_list.append((sub_name, sub_path, sub_icon))
-        else:
-            # Load nested subcategories
-            parts = hierarchy_path.split(":")[1:]  # Ignore first "cat"
+                    add_subcategories(subcategories, f"{_CAT_PREFIX}{cat_name}")
+        elif kind == "cat":
+            # Load nested subcategories: navigate to current level
             current_categories = categories
-
-            # Navigate to current level
             for i, part in enumerate(parts):
                 if part in current_categories:
                     if i == len(parts) - 1:  # Last level
                         subcategories = current_categories[part].get("subcategories", {})
                         if subcategories:
-                            sorted_subcats = sorted(subcategories.items(), key=lambda x: x[0].lower())
-
-                            for sub_name, sub_info in sorted_subcats:
-                                sub_icon = sub_info.get("icon", "folder")
-                                full_path = f"cat:{':'.join(parts)}:{sub_name}"
-                                subcategories_list.append((sub_name, full_path, sub_icon))
+                            add_subcategories(subcategories, hierarchy_path)
                     else:
                         current_categories = current_categories[part].get("subcategories", {})
 
-        # Collect projects at current level
-        if not hierarchy_path or hierarchy_path == "categories":
-            # Projects without category
-            category_name = None
-            subcategory_path = None
-        else:
-            parts = hierarchy_path.split(":")[1:]
-            if len(parts) == 1:
-                category_name = parts[0]
-                subcategory_path = None
-            else:
-                category_name = parts[0]
-                subcategory_path = ":".join(parts[1:])
-
-        # Filter and collect projects
-        category_projects = []
-        for project_name, project_info in projects.items():
-            if isinstance(project_info, str):
-                project_path = project_info
-                project_category = None
-                project_subcategory = None
-            else:
-                project_path = project_info.get("path", "")
-                project_category = project_info.get("category", None)
-                project_subcategory = project_info.get("subcategory", None)
-
-            # Check if project belongs to current level
-            belongs_to_level = False
-            if category_name:
-                if project_category == category_name:
-                    if subcategory_path:
-                        if project_subcategory:
-                            project_sub_path = project_subcategory
-                            if subcategory_path == project_sub_path or project_sub_path.startswith(subcategory_path + ":"):
-                                belongs_to_level = True
-                    else:
-                        # If no subcategory specified, show projects without subcategory
-                        if not project_subcategory:
-                            belongs_to_level = True
-            else:
-                # Show projects without category
-                if not project_category:
-                    belongs_to_level = True
-
-            if belongs_to_level:
-                is_fav = config.is_favorite(project_path, "project") if config else False
-                category_projects.append((project_name, project_path, is_fav))
-
-        # Filter and collect files
-        category_files = []
-        for file_name, file_info in files.items():
-            if isinstance(file_info, str):
-                file_path = file_info
-                file_category = None
-                file_subcategory = None
-            else:
-                file_path = file_info.get("path", "")
-                file_category = file_info.get("category", None)
-                file_subcategory = file_info.get("subcategory", None)
-
-            # Check if file belongs to current level
-            belongs_to_level = False
-            if category_name:
-                if file_category == category_name:
-                    if subcategory_path:
-                        if file_subcategory:
-                            file_sub_path = file_subcategory
-                            if subcategory_path == file_sub_path or file_sub_path.startswith(subcategory_path + ":"):
-                                belongs_to_level = True
-                    else:
-                        if not file_subcategory:
-                            belongs_to_level = True
-            else:
-                if not file_category:
-                    belongs_to_level = True
+        # Collect projects and files at current level, only looking at the
+        # entries indexed under this category
+        belongs = _level_filter(category_name, subcategory_path)
+        item_groups = []
+        for items, icon_name, item_type in ((projects, _ICON_CODE, "project"), (files, _ICON_FILE, "file")):
+            keyed_rows = []
+            category_index = _index_by_category(items, config)
+            for item_name, item_path, item_subcategory in category_index.get(category_name or None, ()):
+                if not belongs(item_subcategory):
+                    continue
 
-            if belongs_to_level:
-                is_fav = config.is_favorite(file_path, "file") if config else False
-                category_files.append((file_name, file_path, is_fav))
+                is_fav = config.is_favorite(item_path, item_type) if config else False
+                row = (item_name, item_path, True, icon_name, is_fav, False)
+                keyed_rows.append(((not is_fav, item_name.casefold()), row))
+            item_groups.append(keyed_rows)
 
-        # Sort projects and files alphabetically, but prioritize favorites
-        category_projects.sort(key=lambda x: (not x[2], x[0].lower()))  # Favorites first, then alphabetical
-        category_files.sort(key=lambda x: (not x[2], x[0].lower()))
+        # Subcategories FIRST (prioritized at top), then projects, then files;
+        # each group favorites first, then alphabetical
+        rows = _sorted_rows(subcategories_with_fav)
+        for keyed_rows in item_groups:
+            rows.extend(_sorted_rows(keyed_rows))
 
-        # Sort subcategories: favorites first, then alphabetically
-        subcategories_with_fav = []
-        for sub_name, sub_path, sub_icon in subcategories_list:
-            is_fav = config.is_favorite(sub_path, "category") if config else False
-            subcategories_with_fav.append((sub_name, sub_path, sub_icon, is_fav))
-        subcategories_with_fav.sort(key=lambda x: (not x[3], x[0].lower()))
+        self._populate(rows)
 
-        # Add subcategories FIRST (prioritized at top)
-        for sub_name, sub_path, sub_icon, is_fav in subcategories_with_fav:
-            self.store.append([sub_name, sub_path, True, sub_icon, is_fav, False])
+    def _populate(self, rows):
+        """
+        Bulk-insert rows into the store
 
-        # Then add projects (below subcategories)
-        for project_name, project_path, is_fav in category_projects:
-            self.store.append([project_name, project_path, True, "code", is_fav, False])
+        The first chunk is inserted with the model detached from the view so
+        GTK doesn't revalidate the tree for every row. Anything beyond that is
+        appended from an idle callback, a chunk at a time, so very large
+        columns don't block the main loop.
 
-        # Finally add files (below projects)
-        for file_name, file_path, is_fav in category_files:
-            self.store.append([file_name, file_path, True, "text-x-generic", is_fav, False])
+        Args:
+            rows: Sequence of (display_name, full_path, is_dir, icon_name, is_favorite, is_in_breadcrumb)
+        """
+        self.cancel_populate()
+
+        self._path_to_row = {}
+        self.content_version = next(_content_versions)
+        if not rows:
+            return
+
+        store = self.store
+        treeview = self.treeview
+        path_to_row = self._path_to_row
+        index = store.iter_n_children(None)
+        for offset, row in enumerate(rows):
+            path_to_row.setdefault(row[1], index + offset)
+
+        pending = iter(rows)
+        treeview.set_model(None)
+        try:
+            for row in islice(pending, _POPULATE_CHUNK):
+                store.insert_with_valuesv(-1, _STORE_COLUMNS, row)
+        finally:
+            treeview.set_model(store)
+
+        if len(rows) > _POPULATE_CHUNK:
+            self._populate_source = GLib.idle_add(
+                self._insert_next_chunk, pending, priority=GLib.PRIORITY_HIGH_IDLE
+            )
+
+    def _insert_next_chunk(self, pending):
+        """
+        Append the next chunk of rows queued by _populate
+
+        Args:
+            pending: Iterator over the rows still to insert
+
+        Returns:
+            True while rows remain (keeps the idle source alive), False otherwise
+        """
+        store = self.store
+        inserted = 0
+        for row in islice(pending, _POPULATE_CHUNK):
+            store.insert_with_valuesv(-1, _STORE_COLUMNS, row)
+            inserted += 1
+        # New rows may hold items the breadcrumb trail has to mark
+        self.content_version = next(_content_versions)
+
+        if inserted < _POPULATE_CHUNK:
+            self._populate_source = None
+            return False
+        return True
+
+    def cancel_populate(self):
+        """Stop inserting rows still queued by _populate"""
+        if self._populate_source is not None:
+            GLib.source_remove(self._populate_source)
+            self._populate_source = None
+
+    def clear_items(self):
+        """Empty the column, dropping any rows still queued by _populate"""
+        self.cancel_populate()
+        self.store.clear()
+        self._path_to_row = {}
+        self.content_version = next(_content_versions)
 
     def get_selected_path(self):
         """Get currently selected path"""
-        selection = self.treeview.get_selection()
+        selection = self.selection
         model, iter = selection.get_selected()
         if iter:
             return model.get_value(iter, 1)
@@ -641,7 +901,7 @@ class ColumnBrowser(Gtk.ScrolledWindow):
         """Select first item in list"""
         first_iter = self.store.get_iter_first()
         if first_iter:
-            selection = self.treeview.get_selection()
+            selection = self.selection
             selection.select_iter(first_iter)
 
             # Manually trigger selection event
@@ -672,7 +932,7 @@ class ColumnBrowser(Gtk.ScrolledWindow):
         Returns:
             True if current_path is "categories" or None
         """
-        return self.current_path is None or self.current_path == "categories"
+        return self.current_path is None or self.current_path == _ROOT_PATH
 
     def get_hierarchy_info(self):
         """
@@ -687,61 +947,24 @@ class ColumnBrowser(Gtk.ScrolledWindow):
                 'full_path': str
             }
         """
-        hierarchy_info = {
-            'level': 0,
-            'category': None,
-            'subcategory_path': None,
+        # Category and projects views share the same parsed layout; anything
+        # else (root, search results, directories) parses to level 0 with no
+        # category, so the cached tuple maps straight onto the result
+        _, category, subcategory_path, parts = self._parse_path()
+        return {
+            'level': len(parts),
+            'category': category,
+            'subcategory_path': subcategory_path,
             'full_path': self.current_path or ""
         }
 
-        current_path = self.current_path
-
-        if not current_path or current_path == "categories":
-            # Root level
-            hierarchy_info['level'] = 0
-            return hierarchy_info
-
-        # Parse the hierarchy path
-        if current_path.startswith("cat:"):
-            parts = current_path.split(":")[1:]  # Remove "cat:" prefix
-            hierarchy_info['level'] = len(parts)
-
-            if len(parts) >= 1:
-                hierarchy_info['category'] = parts[0]
-
-            if len(parts) > 1:
-                hierarchy_info['subcategory_path'] = ":".join(parts[1:])
-
-        elif current_path.startswith("projects:"):
-            # Projects view - extract the category path
-            cat_path = current_path.split(":", 1)[1]
-            if cat_path.startswith("cat:"):
-                parts = cat_path.split(":")[1:]
-                hierarchy_info['level'] = len(parts)
-                if len(parts) >= 1:
-                    hierarchy_info['category'] = parts[0]
-                if len(parts) > 1:
-                    hierarchy_info['subcategory_path'] = ":".join(parts[1:])
-
-        return hierarchy_info
-
 
     def _setup_drag_and_drop(self):
         """Setup drag and drop for this column"""
-        import logging
-        from gi.repository import Gdk
-
-        logger = logging.getLogger(__name__)
-
-        # Define target types for drag and drop
-        targets = [
-            Gtk.TargetEntry.new("text/uri-list", 0, 0)
-        ]
-
         # Enable drag and drop on the treeview
         self.treeview.drag_dest_set(
             Gtk.DestDefaults.ALL,
-            targets,
+            _TARGETS,
             Gdk.DragAction.COPY
         )
 
@@ -751,19 +974,11 @@ class ColumnBrowser(Gtk.ScrolledWindow):
 
     def _on_drag_motion(self, widget, context, x, y, time):
         """Handle drag motion to show visual feedback"""
-        from gi.repository import Gdk
         Gdk.drag_status(context, Gdk.DragAction.COPY, time)
         return True
 
     def _on_drag_data_received(self, widget, context, x, y, data, info, time):
         """Handle dropped files or folders on this column"""
-        import logging
-        import os
-        import urllib.parse
-        from gi.repository import Gtk
-
-        logger = logging.getLogger(__name__)
-
         try:
             if not self.parent_window:
                 logger.warning("No parent window reference for drag and drop")
@@ -784,20 +999,18 @@ class ColumnBrowser(Gtk.ScrolledWindow):
 
             # Process each dropped item
             for uri in uris:
-                # Convert URI to path
-                if uri.startswith('file://'):
-                    path = uri[7:]  # Remove 'file://' prefix
-                    # Decode URL encoding
-                    path = urllib.parse.unquote(path)
-
-                    logger.info(f"Processing dropped item: {path}")
-
-                    if os.path.isdir(path):
-                        self.parent_window._add_project_from_drop(path, pre_config)
-                    elif os.path.isfile(path):
-                        self.parent_window._add_file_from_drop(path, pre_config)
-                    else:
-                        logger.warning(f"Dropped item is neither file nor directory: {path}")
+                path = path_from_dropped_uri(uri)
+                if path is None:
+                    continue
+
+                logger.info(f"Processing dropped item: {path}")
+
+                if os.path.isdir(path):
+                    self.parent_window._add_project_from_drop(path, pre_config)
+                elif os.path.isfile(path):
+                    self.parent_window._add_file_from_drop(path, pre_config)
+                else:
+                    logger.warning(f"Dropped item is neither file nor directory: {path}")
 
             Gtk.drag_finish(context, True, False, time)
 
@@ -807,32 +1020,18 @@ class ColumnBrowser(Gtk.ScrolledWindow):
 
     def _get_pre_config_for_drop(self):
         """Extract pre_config from this column's current state"""
-        import logging
-        logger = logging.getLogger(__name__)
-
         try:
-            current_path = self.current_path
-            if not current_path or current_path == "categories":
-                # Root column - no pre-selection
+            kind, category, _, parts = self._parse_path()
+            if kind != "cat":
+                # Root column or non-category view - no pre-selection
                 return None
 
-            # Parse the current path to extract category/subcategory
-            if current_path.startswith('cat:'):
-                parts = current_path[4:].split('/')
-                if len(parts) == 1 and ':' not in parts[0]:
-                    # Category only (e.g., "cat:Work")
-                    return {'category': parts[0], 'subcategory': None}
-                else:
-                    # Parse with colons (e.g., "cat:Work:Backend")
-                    path_parts = current_path[4:].split(':')
-                    if len(path_parts) == 1:
-                        # Category only
-                        return {'category': path_parts[0], 'subcategory': None}
-                    elif len(path_parts) >= 2:
-                        # Category and subcategory
-                        return {'category': path_parts[0], 'subcategory': path_parts[1]}
+            if len(parts) == 1:
+                # Category only (e.g., "cat:Work")
+                return {'category': category, 'subcategory': None}
 
-            return None
+            # Category and subcategory (e.g., "cat:Work:Backend")
+            return {'category': category, 'subcategory': parts[1]}
         except Exception as e:
             logger.error(f"Error extracting pre_config from column: {e}")
             return None
@@ -5,11 +5,31 @@ Keyboard shortcuts handler for Code Launcher
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gdk, Gtk
+from gi.repository import Gdk, GLib
 import logging
+from src.dialogs import show_create_category_dialog, show_add_project_dialog
+from src.ui.column_browser import classify_item
+from utils.text_editor_utils import open_file_in_editor
 
 logger = logging.getLogger(__name__)
 
+# Gdk constants resolved once at import instead of on every key press
+_CONTROL_MASK = Gdk.ModifierType.CONTROL_MASK
+_KEY_1 = Gdk.KEY_1
+_KEY_9 = Gdk.KEY_9
+
+# Minimum interval (ms) between autorepeated arrow-key moves. Autorepeat
+# usually fires every 25-40 ms, so held arrows move at most every other repeat
+KEYBOARD_DEBOUNCE_MS = 50
+
+# Modifier keys pressed on their own (e.g. the Ctrl press before Ctrl+F)
+_MODIFIER_KEYS = frozenset((
+    Gdk.KEY_Shift_L, Gdk.KEY_Shift_R, Gdk.KEY_Control_L, Gdk.KEY_Control_R,
+    Gdk.KEY_Caps_Lock, Gdk.KEY_Shift_Lock, Gdk.KEY_Meta_L, Gdk.KEY_Meta_R,
+    Gdk.KEY_Alt_L, Gdk.KEY_Alt_R, Gdk.KEY_Super_L, Gdk.KEY_Super_R,
+    Gdk.KEY_Hyper_L, Gdk.KEY_Hyper_R, Gdk.KEY_ISO_Level3_Shift,
+))
+
 
 class KeyboardHandler:
     """Manages keyboard shortcuts"""
@@ -23,34 +43,83 @@ class KeyboardHandler:
         """
         self.window = window
         self.last_focused_column_index = None  # Remember which column we came from when going to search
-        self.column_selections = {}  # Store last selection for each column index
+        self.column_selections = {}  # Column index -> item path (store column 1) last selected there
+        self._last_nav_keyval = None  # Arrow key of the last navigation handled
+        self._last_nav_time = 0  # Its event timestamp (ms), for autorepeat debouncing
+        self._last_breadcrumb_key = None  # State the breadcrumb trail was last drawn for
+
+    def _get_focused_column(self):
+        """
+        Find the column whose tree view has keyboard focus
+
+        Uses the column recorded by ColumnBrowser's focus handlers and only asks
+        each tree view when that record is missing or points at a removed column.
+
+        Returns:
+            Tuple of (index, column), or (None, None) if no column has focus
+        """
+        columns = self.window.columns
+        focused = getattr(self.window, 'focused_column', None)
+        if focused is not None:
+            for i, column in enumerate(columns):
+                if column is focused:
+                    return i, column
+
+        # No usable record (e.g. focus set before the handlers ran): ask the views
+        for i, column in enumerate(columns):
+            if column.treeview.has_focus():
+                return i, column
+        return None, None
+
+    def _get_selected_item(self):
+        """
+        Find the selected item the Enter/Ctrl shortcuts act on
+
+        Columns clear their selection on focus-out, so the focused column is
+        checked first; otherwise the last column with a selection wins.
+
+        Returns:
+            Tuple of (column, iter, item_path, item_type), or None if nothing is selected
+        """
+        columns = self.window.columns
+        _, focused = self._get_focused_column()
+        candidates = reversed(columns) if focused is None else (focused, *reversed(columns))
+        for column in candidates:
+            model, iter = column.selection.get_selected()
+            if iter:
+                selected_path = model.get_value(iter, 1)
+                if selected_path:
+                    item_type = classify_item(selected_path, model.get_value(iter, 3))
+                    return column, iter, selected_path, item_type
+        return None
 
     def _update_breadcrumb_trail(self):
         """Update the visual breadcrumb trail across all columns"""
+        # Find which column currently has focus
+        focused_column_index, _ = self._get_focused_column()
+
+        # Skip the rebuild when focus, column contents and the saved selections
+        # before the focused column are all unchanged since the last pass
+        marked = range(focused_column_index) if focused_column_index is not None else ()
+        key = (
+            focused_column_index,
+            tuple(column.content_version for column in self.window.columns),
+            tuple((i, self.column_selections[i]) for i in marked if i in self.column_selections),
+        )
+        if key == self._last_breadcrumb_key:
+            return
+        self._last_breadcrumb_key = key
+
         # Clear all breadcrumb markings first
         for column in self.window.columns:
             column.clear_breadcrumb_trail()
 
-        # Find which column currently has focus
-        focused_column_index = None
-        for i, column in enumerate(self.window.columns):
-            if column.treeview.has_focus():
-                focused_column_index = i
-                break
-
         # Only mark breadcrumb trail in columns BEFORE the focused one
-        if focused_column_index is not None:
-            for i in range(focused_column_index):
-                if i in self.column_selections:
-                    try:
-                        path = self.column_selections[i]
-                        column = self.window.columns[i]
-                        iter = column.store.get_iter(path)
-                        if iter:
-                            item_path = column.store.get_value(iter, 1)
-                            column.mark_breadcrumb_item(item_path)
-                    except:
-                        pass
+        columns = self.window.columns
+        for i in marked:
+            item_path = self.column_selections.get(i)
+            if item_path is not None:
+                columns[i].mark_breadcrumb_item(item_path)
 
     def on_key_press(self, widget, event):
         """
@@ -63,251 +132,169 @@ class KeyboardHandler:
         Returns:
             True if event was handled, False otherwise
         """
-        ctrl = event.state & Gdk.ModifierType.CONTROL_MASK
-
-        # ESC to close
-        if event.keyval == Gdk.KEY_Escape:
-            self.window.destroy()
-            return True
-
-        # Enter to open selected item
-        if event.keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
-            self._open_selected_item()
-            return True
-
-        # Ctrl+O to open selected item
-        if ctrl and event.keyval == Gdk.KEY_o:
-            self._open_selected_item()
-            return True
-
-        # Ctrl+F to focus search
-        if ctrl and event.keyval == Gdk.KEY_f:
-            if hasattr(self.window, 'search_entry'):
-                self.window.search_entry.grab_focus()
-            return True
+        keyval = event.keyval
+        if keyval in _MODIFIER_KEYS:
+            return False
 
-        # Ctrl+N to create new category
-        if ctrl and event.keyval == Gdk.KEY_n:
-            self._create_new_category()
+        # ESC, Enter, arrows and Ctrl+O/F/N/P/D/R in one lookup
+        handler = self._KEY_HANDLERS.get((keyval, bool(event.state & _CONTROL_MASK)))
+        if handler is not None:
+            if handler in self._NAV_HANDLERS:
+                # Drop autorepeat presses that arrive faster than the debounce
+                # interval so held arrows don't flood the main loop. Synthesized
+                # events carry no timestamp (0) and are never debounced
+                event_time = event.time
+                if (event_time and keyval == self._last_nav_keyval
+                        and 0 <= event_time - self._last_nav_time < self.window.keyboard_debounce_ms):
+                    return True
+                self._last_nav_keyval = keyval
+                self._last_nav_time = event_time
+            handler(self)
             return True
 
-        # Ctrl+P to add project
-        if ctrl and event.keyval == Gdk.KEY_p:
-            self._add_project()
+        # Number keys 1-9 to jump to items
+        if _KEY_1 <= keyval <= _KEY_9:
+            self._select_item_by_index(keyval - _KEY_1)
             return True
 
-        # Ctrl+D to toggle favorite
-        if ctrl and event.keyval == Gdk.KEY_d:
-            self._toggle_favorite()
-            return True
+        return False
 
-        # Ctrl+R to show recents
-        if ctrl and event.keyval == Gdk.KEY_r:
-            self._show_recents()
-            return True
+    def _close_window(self):
+        """Close the launcher"""
+        self.window.destroy()
 
-        # Arrow keys for navigation
-        if event.keyval == Gdk.KEY_Left:
-            self._navigate_left()
-            return True
+    def _focus_search(self):
+        """Move focus to the search entry"""
+        search_entry = self.window.search_entry
+        if search_entry is not None:
+            search_entry.grab_focus()
 
-        if event.keyval == Gdk.KEY_Right:
-            self._navigate_right()
-            return True
+    def _open_selected_item(self):
+        """Open the currently selected item"""
+        if not self.window.columns:
+            return
 
-        if event.keyval == Gdk.KEY_Up:
-            self._navigate_up()
-            return True
+        # Focused column first, then the last column with a selection
+        item = self._get_selected_item()
+        if item is None:
+            return
 
-        if event.keyval == Gdk.KEY_Down:
-            self._navigate_down()
-            return True
+        column, _, selected_path, item_type = item
 
-        # Number keys 1-9 to jump to items
-        if event.keyval >= Gdk.KEY_1 and event.keyval <= Gdk.KEY_9:
-            index = event.keyval - Gdk.KEY_1
-            self._select_item_by_index(index)
-            return True
+        if item_type == "category":
+            # It's a category
+            # If in search/recent mode, navigate to it
+            if column.current_path in ["search_results", "recent_items"]:
+                # Clear search
+                if self.window.search_entry is not None:
+                    self.window.search_entry.set_text("")
 
-        return False
+                # Reload normal interface
+                self.window.reload_interface()
 
-    def _open_selected_item(self):
-        """Open the currently selected item"""
-        if not self.window.columns:
+                # Navigate to selected category
+                GLib.idle_add(column._navigate_to_category, selected_path)
+            # Otherwise just return (normal navigation handles it)
             return
-
-        # Find the last column with a selection
-        for column in reversed(self.window.columns):
-            selected_path = column.get_selected_path()
-            if selected_path:
-                # Get the icon to determine type
-                selection = column.treeview.get_selection()
-                model, iter = selection.get_selected()
-                if iter:
-                    icon = model.get_value(iter, 3)
-
-                    if selected_path.startswith("cat:"):
-                        # It's a category
-                        # If in search/recent mode, navigate to it
-                        if column.current_path in ["search_results", "recent_items"]:
-                            # Clear search
-                            if hasattr(self.window, 'search_entry'):
-                                self.window.search_entry.set_text("")
-
-                            # Reload normal interface
-                            self.window.reload_interface()
-
-                            # Navigate to selected category
-                            from gi.repository import GLib
-                            GLib.idle_add(column._navigate_to_category, selected_path)
-                        # Otherwise just return (normal navigation handles it)
-                        return
-                    elif icon == "text-x-generic":
-                        # It's a file
-                        from utils.text_editor_utils import open_file_in_editor
-                        text_editor = getattr(self.window, 'default_text_editor', 'gnome-text-editor')
-                        success = open_file_in_editor(selected_path, text_editor)
-
-                        if success:
-                            # Add to recents
-                            file_name = self.window._get_file_name(selected_path)
-                            if file_name:
-                                self.window.config.add_recent(selected_path, file_name, "file")
-
-                        if self.window.close_on_open:
-                            self.window.destroy()
-                    else:
-                        # It's a project
-                        default_editor = getattr(self.window, 'default_editor', 'kiro')
-                        if default_editor == "vscode":
-                            self.window.open_vscode_project(selected_path)
-                        else:
-                            self.window.open_kiro_project(selected_path)
-                return
+        elif item_type == "file":
+            # It's a file
+            text_editor = self.window.default_text_editor
+            success = open_file_in_editor(selected_path, text_editor)
+
+            if success:
+                # Add to recents
+                file_name = self.window._get_file_name(selected_path)
+                if file_name:
+                    self.window.config.add_recent(selected_path, file_name, "file")
+
+            if self.window.close_on_open:
+                self.window.destroy()
+        else:
+            # It's a project
+            default_editor = self.window.default_editor
+            if default_editor == "vscode":
+                self.window.open_vscode_project(selected_path)
+            else:
+                self.window.open_kiro_project(selected_path)
 
     def _create_new_category(self):
         """Create a new category"""
-        from src.dialogs import show_create_category_dialog
+        window = self.window
 
         def on_create(name, description, icon, parent_category):
+            categories = window.categories
             if parent_category:
                 parts = parent_category.split(":")
-                current_level = self.window.categories
-                for i, part in enumerate(parts[:-1]):
+                current_level = categories
+                for part in parts[:-1]:
                     if part in current_level:
-                        if "subcategories" not in current_level[part]:
-                            current_level[part]["subcategories"] = {}
-                        current_level = current_level[part]["subcategories"]
+                        current_level = current_level[part].setdefault("subcategories", {})
 
                 parent_name = parts[-1]
                 if parent_name in current_level:
-                    if "subcategories" not in current_level[parent_name]:
-                        current_level[parent_name]["subcategories"] = {}
-                    current_level[parent_name]["subcategories"][name] = {
+                    current_level[parent_name].setdefault("subcategories", {})[name] = {
                         "description": description,
                         "icon": icon
                     }
             else:
-                self.window.categories[name] = {
+                categories[name] = {
                     "description": description,
                     "icon": icon,
                     "subcategories": {}
                 }
 
-            self.window.config.save_categories(self.window.categories)
-            self.window.reload_interface()
+            window.config.save_categories(categories)
+            window.reload_interface()
 
-        show_create_category_dialog(self.window, self.window.categories, on_create)
+        show_create_category_dialog(window, window.categories, on_create)
 
     def _add_project(self):
         """Add a new project"""
-        from src.dialogs import show_add_project_dialog
+        window = self.window
 
         def on_add(name, project_info):
-            self.window.projects[name] = project_info
-            self.window.config.save_projects(self.window.projects)
-            self.window.reload_interface()
+            projects = window.projects
+            projects[name] = project_info
+            window.config.save_projects(projects)
+            window.reload_interface()
 
-        show_add_project_dialog(self.window, self.window.categories, on_add)
+        show_add_project_dialog(window, window.categories, on_add)
 
     def _toggle_favorite(self):
         """Toggle favorite status of selected item"""
         if not self.window.columns:
             return
 
-        for column in reversed(self.window.columns):
-            selected_path = column.get_selected_path()
-            if selected_path:
-                selection = column.treeview.get_selection()
-                model, iter = selection.get_selected()
-                if iter:
-                    icon = model.get_value(iter, 3)
-
-                    # Determine item type
-                    if selected_path.startswith("cat:"):
-                        item_type = "category"
-                    elif icon == "text-x-generic":
-                        item_type = "file"
-                    else:
-                        item_type = "project"
-
-                    is_fav = self.window.config.toggle_favorite(selected_path, item_type)
-                    status = "added to" if is_fav else "removed from"
-                    logger.info(f"Item {status} favorites: {selected_path}")
-
-                    # Refresh the column to show star icon
-                    current_path = column.current_path
-
-                    # Check if we're in the root categories view or a nested view
-                    if current_path is None or current_path == "categories":
-                        # Root level - use load_hierarchy_level with None
-                        column.load_hierarchy_level(
-                            self.window.categories,
-                            None,
-                            self.window.projects,
-                            self.window.files
-                        )
-                    elif current_path and current_path.startswith("cat:"):
-                        # We're in a category view - use load_mixed_content
-                        column.load_mixed_content(
-                            self.window.categories,
-                            current_path,
-                            self.window.projects,
-                            self.window.files
-                        )
-                    else:
-                        # Fallback
-                        if hasattr(column, 'load_mixed_content'):
-                            column.load_mixed_content(
-                                self.window.categories,
-                                column.current_path,
-                                self.window.projects,
-                                self.window.files
-                            )
-                        elif hasattr(column, 'load_hierarchy_level'):
-                            column.load_hierarchy_level(
-                                self.window.categories,
-                                column.current_path,
-                                self.window.projects,
-                                self.window.files
-                            )
-                return
+        item = self._get_selected_item()
+        if item is None:
+            return
+
+        column, iter, selected_path, item_type = item
+
+        is_fav = self.window.config.toggle_favorite(selected_path, item_type)
+        status = "added to" if is_fav else "removed from"
+        logger.info(f"Item {status} favorites: {selected_path}")
+
+        # Refresh the star and the row's position without reloading the column
+        column.set_item_favorite(iter, is_fav)
 
     def _show_recents(self):
         """Show recent items in search"""
-        if hasattr(self.window, 'search_entry'):
-            self.window.search_entry.set_text("@recent")
-            self.window.search_entry.grab_focus()
+        search_entry = self.window.search_entry
+        if search_entry is not None:
+            search_entry.set_text("@recent")
+            search_entry.grab_focus()
 
     def _save_current_selection(self, column_index):
         """Save the current selection for a column"""
         if column_index < len(self.window.columns):
             column = self.window.columns[column_index]
-            selection = column.treeview.get_selection()
+            selection = column.selection
             model, iter = selection.get_selected()
             if iter:
-                path = model.get_path(iter)
-                self.column_selections[column_index] = path
+                # Keep the item path rather than the row position so the
+                # selection survives the column being reloaded or re-sorted
+                self.column_selections[column_index] = model.get_value(iter, 1)
                 # Update breadcrumb trail after saving
                 self._update_breadcrumb_trail()
 
@@ -316,22 +303,21 @@ class KeyboardHandler:
         if column_index < len(self.window.columns):
             column = self.window.columns[column_index]
 
-            # Try to restore saved selection
-            if column_index in self.column_selections:
-                try:
-                    saved_path = self.column_selections[column_index]
-                    selection = column.treeview.get_selection()
-                    selection.select_path(saved_path)
-                    column.treeview.set_cursor(saved_path, None, False)
-                    column.treeview.scroll_to_cell(saved_path, None, False, 0, 0)
+            # Try to restore saved selection (the item may no longer be listed)
+            saved_item = self.column_selections.get(column_index)
+            if saved_item is not None:
+                iter = column.find_item_iter(saved_item)
+                if iter:
+                    path = column.store.get_path(iter)
+                    column.selection.select_iter(iter)
+                    column.treeview.set_cursor(path, None, False)
+                    column.treeview.scroll_to_cell(path, None, False, 0, 0)
                     # Update breadcrumb trail after restoring
                     self._update_breadcrumb_trail()
                     return True
-                except:
-                    pass
 
             # If no saved selection or it failed, select first item
-            selection = column.treeview.get_selection()
+            selection = column.selection
             first_iter = column.store.get_iter_first()
             if first_iter:
                 path = column.store.get_path(first_iter)
@@ -346,79 +332,70 @@ class KeyboardHandler:
         """Navigate to previous column"""
         if len(self.window.columns) > 1:
             # Focus previous column
-            for i, column in enumerate(self.window.columns):
-                if column.treeview.has_focus() and i > 0:
-                    # Save current selection before leaving
-                    self._save_current_selection(i)
+            i, _ = self._get_focused_column()
+            if i is not None and i > 0:
+                # Save current selection before leaving
+                self._save_current_selection(i)
 
-                    prev_column = self.window.columns[i-1]
-                    prev_column.treeview.grab_focus()
+                prev_column = self.window.columns[i-1]
+                prev_column.treeview.grab_focus()
 
-                    # Restore previous selection
-                    self._restore_selection(i-1)
-                    return
+                # Restore previous selection
+                self._restore_selection(i-1)
 
     def _navigate_right(self):
         """Navigate to next column"""
         if len(self.window.columns) > 1:
             # Focus next column
-            for i, column in enumerate(self.window.columns):
-                if column.treeview.has_focus() and i < len(self.window.columns) - 1:
-                    next_column = self.window.columns[i+1]
+            i, _ = self._get_focused_column()
+            if i is not None and i < len(self.window.columns) - 1:
+                next_column = self.window.columns[i+1]
 
-                    # Check if next column is empty
-                    if not next_column.store.get_iter_first():
-                        # Column is empty, don't navigate
-                        return
+                # Check if next column is empty
+                if not next_column.store.get_iter_first():
+                    # Column is empty, don't navigate
+                    return
 
-                    # Save current selection before leaving
-                    self._save_current_selection(i)
+                # Save current selection before leaving
+                self._save_current_selection(i)
 
-                    next_column.treeview.grab_focus()
+                next_column.treeview.grab_focus()
 
-                    # Restore next column selection
-                    self._restore_selection(i+1)
-                    return
+                # Restore next column selection
+                self._restore_selection(i+1)
 
     def _navigate_up(self):
         """Navigate up in current column or to search if at top"""
         # Check if search entry has focus
-        if hasattr(self.window, 'search_entry') and self.window.search_entry.has_focus():
+        search_entry = self.window.search_entry
+        if search_entry is not None and search_entry.has_focus():
             # Don't do anything, let search handle it
             return
 
         # Check if we're in a column
-        focused_column = None
-        focused_column_index = None
-        for i, column in enumerate(self.window.columns):
-            if column.treeview.has_focus():
-                focused_column = column
-                focused_column_index = i
-                break
+        focused_column_index, focused_column = self._get_focused_column()
 
         if focused_column:
-            selection = focused_column.treeview.get_selection()
+            selection = focused_column.selection
             model, iter = selection.get_selected()
 
             if iter:
                 # Check if we're at the top
-                path = model.get_path(iter)
-                if path.get_indices()[0] == 0:
+                prev_iter = model.iter_previous(iter)
+                if prev_iter is None:
                     # At the top, move to search and remember this column and item
                     self.last_focused_column_index = focused_column_index
                     self._save_current_selection(focused_column_index)
-                    if hasattr(self.window, 'search_entry'):
-                        self.window.search_entry.grab_focus()
+                    if search_entry is not None:
+                        search_entry.grab_focus()
                         # Position cursor at end of text
-                        self.window.search_entry.set_position(-1)
+                        search_entry.set_position(-1)
                     return
 
                 # Move to previous item
-                if path.get_indices()[0] > 0:
-                    prev_path = Gtk.TreePath.new_from_indices([path.get_indices()[0] - 1])
-                    selection.select_path(prev_path)
-                    focused_column.treeview.set_cursor(prev_path, None, False)
-                    focused_column.treeview.scroll_to_cell(prev_path, None, False, 0, 0)
+                # set_cursor already selects the row and scrolls it into view
+                prev_path = model.get_path(prev_iter)
+                focused_column.treeview.set_cursor(prev_path, None, False)
             else:
                 # No selection, select first item
                 first_iter = model.get_iter_first()
@@ -431,7 +408,8 @@ class KeyboardHandler:
     def _navigate_down(self):
         """Navigate down in current column or from search to first column"""
         # Check if search entry has focus
-        if hasattr(self.window, 'search_entry') and self.window.search_entry.has_focus():
+        search_entry = self.window.search_entry
+        if search_entry is not None and search_entry.has_focus():
             # Move focus to the column we came from, or first column if none remembered
             if self.window.columns:
                 # Use remembered column index, or default to first column
@@ -455,24 +433,19 @@ class KeyboardHandler:
             return
 
         # Check if we're in a column
-        focused_column = None
-        for column in self.window.columns:
-            if column.treeview.has_focus():
-                focused_column = column
-                break
+        _, focused_column = self._get_focused_column()
 
         if focused_column:
-            selection = focused_column.treeview.get_selection()
+            selection = focused_column.selection
             model, iter = selection.get_selected()
 
             if iter:
                 # Move to next item
                 next_iter = model.iter_next(iter)
                 if next_iter:
+                    # set_cursor already selects the row and scrolls it into view
                     next_path = model.get_path(next_iter)
-                    selection.select_path(next_path)
                     focused_column.treeview.set_cursor(next_path, None, False)
-                    focused_column.treeview.scroll_to_cell(next_path, None, False, 0, 0)
             else:
                 # No selection, select first item
                 first_iter = model.get_iter_first()
@@ -484,19 +457,40 @@ class KeyboardHandler:
 
     def _select_item_by_index(self, index):
         """Select item by index (0-8) in focused column"""
-        for column in self.window.columns:
-            if column.treeview.has_focus():
-                model = column.store
-                iter = model.get_iter_first()
-                current_index = 0
-
-                while iter and current_index < index:
-                    iter = model.iter_next(iter)
-                    current_index += 1
+        _, column = self._get_focused_column()
+        if column is not None:
+            model = column.store
+            iter = model.iter_nth_child(None, index)
+            if iter:
+                selection = column.selection
+                selection.select_iter(iter)
+                path = model.get_path(iter)
+                column.treeview.scroll_to_cell(path, None, False, 0, 0)
 
-                if iter:
-                    selection = column.treeview.get_selection()
-                    selection.select_iter(iter)
-                    path = model.get_path(iter)
-                    column.treeview.scroll_to_cell(path, None, False, 0, 0)
-                return
+    # Keyval -> unbound handler tables, built once when the class is defined
+    _PLAIN_KEYS = {
+        Gdk.KEY_Escape: _close_window,
+        Gdk.KEY_Return: _open_selected_item,
+        Gdk.KEY_KP_Enter: _open_selected_item,
+        Gdk.KEY_Left: _navigate_left,
+        Gdk.KEY_Right: _navigate_right,
+        Gdk.KEY_Up: _navigate_up,
+        Gdk.KEY_Down: _navigate_down,
+    }
+    _CTRL_KEYS = {
+        Gdk.KEY_o: _open_selected_item,
+        Gdk.KEY_f: _focus_search,
+        Gdk.KEY_n: _create_new_category,
+        Gdk.KEY_p: _add_project,
+        Gdk.KEY_d: _toggle_favorite,
+        Gdk.KEY_r: _show_recents,
+    }
+
+    # Combined (keyval, ctrl_held) -> handler table used by on_key_press; plain
+    # keys also fire with Ctrl held so Ctrl+arrows keep navigating
+    _KEY_HANDLERS = {(keyval, False): handler for keyval, handler in _PLAIN_KEYS.items()}
+    _KEY_HANDLERS.update({(keyval, True): handler for keyval, handler in _PLAIN_KEYS.items()})
+    _KEY_HANDLERS.update({(keyval, True): handler for keyval, handler in _CTRL_KEYS.items()})
+
+    # Arrow-key handlers subject to autorepeat debouncing
+    _NAV_HANDLERS = frozenset((_navigate_left, _navigate_right, _navigate_up, _navigate_down))
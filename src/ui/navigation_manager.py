@@ -8,6 +8,9 @@ gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GLib
 from src.ui.column_browser import ColumnBrowser
 
+# Column types accepted by NavigationManager.add_column
+_COLUMN_TYPES = frozenset(("categories", "hierarchy", "mixed", "projects", "directory"))
+
 
 class NavigationManager:
     """Manages column navigation and hierarchy"""
@@ -32,21 +35,24 @@ class NavigationManager:
         Returns:
             ColumnBrowser instance
         """
-        if column_type not in ["categories", "hierarchy", "mixed", "projects", "directory"]:
+        if column_type not in _COLUMN_TYPES:
             raise ValueError(f"Invalid column_type: {column_type}")
 
         column = ColumnBrowser(self.on_column_selection, column_type, self.window)
+        window = self.window
+
+        # Dispatch directly to the loader without building per-call lambdas
+        if column_type == "categories":
+            column.load_hierarchy_level(window.categories, None, window.projects, window.files)
+        elif column_type == "hierarchy":
+            column.load_hierarchy_level(window.categories, path, window.projects, window.files)
+        elif column_type == "mixed":
+            column.load_mixed_content(window.categories, path, window.projects, window.files)
+        elif column_type == "projects":
+            column.load_projects_at_level(path, window.projects)
+        else:
+            column.load_directory(path)
 
-        # Mapeo de tipos a métodos de carga
-        loaders = {
-            "categories": lambda: column.load_hierarchy_level(self.window.categories, None, self.window.projects, self.window.files),
-            "hierarchy": lambda: column.load_hierarchy_level(self.window.categories, path, self.window.projects, self.window.files),
-            "mixed": lambda: column.load_mixed_content(self.window.categories, path, self.window.projects, self.window.files),
-            "projects": lambda: column.load_projects_at_level(path, self.window.projects),
-            "directory": lambda: column.load_directory(path)
-        }
-
-        loaders[column_type]()
         self._pack_column(column)
         return column
 
@@ -59,7 +65,7 @@ class NavigationManager:
         """
         self.window.columns.append(column)
         self.window.columns_box.pack_start(column, True, True, 1)
-        column.show_all()
+        column.show()
 
         # Ensure we always have 3 columns visible
         self._ensure_three_columns()
@@ -81,7 +87,7 @@ class NavigationManager:
             empty_column.current_path = "empty"
             self.window.columns.append(empty_column)
             self.window.columns_box.pack_start(empty_column, True, True, 1)
-            empty_column.show_all()
+            empty_column.show()
 
     def on_column_selection(self, path, is_dir, source_column=None):
         """
@@ -116,15 +122,12 @@ class NavigationManager:
 
         if source_column:
             # If we know the source column, find its index
-            for i, column in enumerate(self.window.columns):
-                if column == source_column:
-                    selected_column_index = i
-                    break
+            if source_column in self.window.columns:
+                selected_column_index = self.window.columns.index(source_column)
         else:
             # Otherwise, search for the column with selection
             for i, column in enumerate(self.window.columns):
-                selection = column.treeview.get_selection()
-                model, iter = selection.get_selected()
+                model, iter = column.selection.get_selected()
                 if iter:
                     selected_column_index = i
                     break
@@ -133,7 +136,7 @@ class NavigationManager:
             # Clear all columns after the selected one (but keep them visible)
             for i in range(selected_column_index + 1, len(self.window.columns)):
                 if i < len(self.window.columns):  # Safety check
-                    self.window.columns[i].store.clear()
+                    self.window.columns[i].clear_items()
                     if hasattr(self.window.columns[i], 'current_path'):
                         self.window.columns[i].current_path = "empty"
 
@@ -144,20 +147,28 @@ class NavigationManager:
         Args:
             hierarchy_path: Hierarchy path (e.g., "cat:Web:Frontend")
         """
-        # Parse the path to determine the level
-        path_parts = hierarchy_path.split(":")
-        if len(path_parts) < 2:
+        # Depth level is the number of separators; counting avoids building
+        # a parts list on every selection
+        depth_level = hierarchy_path.count(":")
+        if depth_level < 1:
             return
 
-        # Determine depth level
-        depth_level = len(path_parts) - 1
-
         # Remove columns to the right of the selected level (but keep minimum 3)
         target_columns_count = max(depth_level + 1, 3)
 
-        while len(self.window.columns) > target_columns_count:
-            old_column = self.window.columns.pop()
-            self.window.columns_box.remove(old_column)
+        excess_columns = self.window.columns[target_columns_count:]
+        if excess_columns:
+            del self.window.columns[target_columns_count:]
+            # Remove in one batch, last column first so the remaining children
+            # keep their positions, with child notifications held until the end
+            columns_box = self.window.columns_box
+            columns_box.freeze_child_notify()
+            try:
+                for old_column in reversed(excess_columns):
+                    old_column.cancel_populate()
+                    columns_box.remove(old_column)
+            finally:
+                columns_box.thaw_child_notify()
 
         # Create or reload column for content
         if len(self.window.columns) == depth_level:
@@ -183,6 +194,7 @@ class NavigationManager:
         """Reload the entire interface"""
         # Clear columns
         for column in self.window.columns:
+            column.cancel_populate()
             self.window.columns_box.remove(column)
         self.window.columns.clear()
 
@@ -203,8 +215,7 @@ class NavigationManager:
                 # Select first item in first column
                 first_iter = first_column.store.get_iter_first()
                 if first_iter:
-                    selection = first_column.treeview.get_selection()
-                    selection.select_iter(first_iter)
+                    first_column.selection.select_iter(first_iter)
 
                     # Get the path of first item
                     path = first_column.store.get_value(first_iter, 1)
@@ -212,8 +223,9 @@ class NavigationManager:
                     # Trigger selection to create next column
                     self.on_column_selection(path, True, None)
 
-                    # Schedule cascade selection for next column
-                    GLib.timeout_add(50, self._cascade_select_first)
+                    # The next column is loaded synchronously above, so the
+                    # cascade can run as soon as the main loop is idle
+                    GLib.idle_add(self._cascade_select_first)
         return False
 
     def _cascade_select_first(self):
@@ -229,8 +241,7 @@ class NavigationManager:
 
                 # Only auto-select if it's a subcategory (starts with "cat:")
                 if path and path.startswith("cat:"):
-                    selection = second_column.treeview.get_selection()
-                    selection.select_iter(first_iter)
+                    second_column.selection.select_iter(first_iter)
 
                     # Trigger selection to potentially create next column
                     self.on_column_selection(path, True, None)
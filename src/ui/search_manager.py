@@ -7,6 +7,40 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 import re
+import string
+from functools import lru_cache
+from src.core.config import RevisionCache
+
+# Characters dropped by _normalize_name
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_KEEP_CHARS = frozenset(string.ascii_lowercase + string.digits)
+_ASCII_DELETE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if chr(c) not in _KEEP_CHARS
+))
+
+# Label prefixes for search result rows
+_CATEGORY_LABEL = "📁 "
+_ITEM_LABEL = "📄 "
+
+
+@lru_cache(maxsize=8192)
+def _normalize_name(text):
+    """
+    Lowercase text and drop everything but ASCII letters and digits
+
+    Memoized: project, file and category names repeat across index rebuilds.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text
+    """
+    text = text.lower()
+    # translate is much cheaper than the regex for the common pure-ASCII case
+    if text.isascii():
+        return text.translate(_ASCII_DELETE_TABLE)
+    return _NON_ALNUM_RE.sub('', text)
 
 
 class SearchManager:
@@ -20,6 +54,16 @@ class SearchManager:
             window: FinderStyleWindow instance
         """
         self.window = window
+        # Normalized name indexes of the projects/files/categories dicts
+        self._name_indexes = RevisionCache()
+        # id(index) -> (index, query, matching entries) of the last search
+        self._last_matches = {}
+        # Browsing columns detached while search/recent results are shown,
+        # with the config state they were built from
+        self._saved_columns = None
+        self._saved_revision = None
+        # (search text, config revision) of the last handled search
+        self._last_search = None
 
     def _normalize_text(self, text):
         """
@@ -31,11 +75,7 @@ class SearchManager:
         Returns:
             Normalized text (lowercase, no special chars)
         """
-        # Convert to lowercase
-        text = text.lower()
-        # Remove special characters (keep only alphanumeric)
-        text = re.sub(r'[^a-z0-9]', '', text)
-        return text
+        return _normalize_name(text)
 
     def on_search_changed(self, entry):
         """
@@ -46,9 +86,18 @@ class SearchManager:
         """
         search_text = entry.get_text().lower()
 
+        # search-changed can fire without the text changing (e.g. from input
+        # method composition); skip the re-render unless the data changed too
+        search_key = (search_text, getattr(self.window.config, 'revision', None))
+        if search_key == self._last_search:
+            return
+        self._last_search = search_key
+
         if not search_text:
-            # Restore normal view
-            self.window.reload_interface()
+            # Restore normal view, reusing the columns from before the search
+            # when nothing they show has been saved since
+            if not self._restore_saved_columns():
+                self.window.reload_interface()
             return
 
         # Check for special @recent command
@@ -65,23 +114,72 @@ class SearchManager:
         matching_categories = self._find_matching_categories(normalized_search, self.window.categories)
 
         # Only show items that directly match the search term
-        # Don't include all projects from matching categories
+        # Don't include all projects from matching categories.
+        # Project names are dict keys, so the matches are already unique;
+        # show_search_results does the alphabetical sort
+        self.show_search_results(matching_projects, matching_files, matching_categories)
 
-        # Use dict to avoid duplicates (key = project_name)
-        all_projects = {}
+    def _cached_index(self, source, build):
+        """
+        Return the normalized name index for a projects/files/categories dict
 
-        # Add only projects matching by name
-        for project_name, project_path, category in matching_projects:
-            all_projects[project_name] = (project_name, project_path, category)
+        Args:
+            source: Dictionary the index is built from
+            build: Callable building the list of entries from source
 
-        # Convert dict to list and sort alphabetically
-        final_projects = sorted(list(all_projects.values()), key=lambda x: x[0].lower())
+        Returns:
+            List of entries whose first element is the normalized name
+        """
+        return self._name_indexes.get(source, self.window.config, build)
 
-        if final_projects or matching_files or matching_categories:
-            self.show_search_results(final_projects, matching_files, matching_categories)
-        else:
-            # No results - show empty column
-            self.show_search_results([], [], [])
+    def _filter_index(self, index, normalized_search):
+        """
+        Return the index entries whose normalized name contains the query
+
+        When the query extends the previous one run against the same index
+        (e.g. "web" -> "webs"), only the previous matches can still match, so
+        those are filtered instead of the whole index.
+
+        Args:
+            index: Entry list returned by _cached_index
+            normalized_search: Normalized search query
+
+        Returns:
+            List of matching entries
+        """
+        candidates = index
+        previous = self._last_matches.get(id(index))
+        if previous and previous[0] is index and previous[1] in normalized_search:
+            candidates = previous[2]
+
+        matches = [entry for entry in candidates if normalized_search in entry[0]]
+        if len(self._last_matches) >= 8:
+            self._last_matches.clear()
+        self._last_matches[id(index)] = (index, normalized_search, matches)
+        return matches
+
+    def _build_item_index(self, items):
+        """
+        Build the normalized name index for projects or files
+
+        Args:
+            items: Projects or files dictionary (name -> path or info dict)
+
+        Returns:
+            List of tuples (normalized_name, name, path, category)
+        """
+        entries = []
+        for name, info in items.items():
+            if isinstance(info, str):
+                entries.append((self._normalize_text(name), name, info, "Otros"))
+            else:
+                entries.append((
+                    self._normalize_text(name),
+                    name,
+                    info.get("path", ""),
+                    info.get("category", "Otros")
+                ))
+        return entries
 
     def _find_matching_projects(self, normalized_search):
         """
@@ -93,23 +191,8 @@ class SearchManager:
         Returns:
             List of tuples (project_name, project_path, category)
         """
-        matching_projects = []
-
-        for project_name, project_info in self.window.projects.items():
-            # Normalize project name for comparison
-            normalized_name = self._normalize_text(project_name)
-
-            if normalized_search in normalized_name:
-                if isinstance(project_info, str):
-                    matching_projects.append((project_name, project_info, "Otros"))
-                else:
-                    matching_projects.append((
-                        project_name,
-                        project_info.get("path", ""),
-                        project_info.get("category", "Otros")
-                    ))
-
-        return matching_projects
+        index = self._cached_index(self.window.projects, self._build_item_index)
+        return [entry[1:] for entry in self._filter_index(index, normalized_search)]
 
     def _find_matching_files(self, normalized_search):
         """
@@ -121,108 +204,119 @@ class SearchManager:
         Returns:
             List of tuples (file_name, file_path, category)
         """
-        matching_files = []
-
-        for file_name, file_info in self.window.files.items():
-            # Normalize file name for comparison
-            normalized_name = self._normalize_text(file_name)
-
-            if normalized_search in normalized_name:
-                if isinstance(file_info, str):
-                    matching_files.append((file_name, file_info, "Otros"))
-                else:
-                    matching_files.append((
-                        file_name,
-                        file_info.get("path", ""),
-                        file_info.get("category", "Otros")
-                    ))
+        index = self._cached_index(self.window.files, self._build_item_index)
+        return [entry[1:] for entry in self._filter_index(index, normalized_search)]
 
-        return matching_files
-
-    def _find_matching_categories(self, normalized_search, categories, prefix=""):
+    def _find_matching_categories(self, normalized_search, categories):
         """
-        Find categories matching search text (recursive)
+        Find categories (at any depth) matching search text
 
         Args:
             normalized_search: Normalized search query (lowercase, no special chars)
             categories: Categories dictionary
-            prefix: Current category prefix for nested categories
 
         Returns:
             List of tuples (category_name, category_path, type)
         """
-        matching_categories = []
+        index = self._cached_index(categories, self._build_category_index)
+        return [
+            (cat_name, cat_path, "Category")
+            for _, cat_name, cat_path in self._filter_index(index, normalized_search)
+        ]
 
-        for cat_name, cat_info in categories.items():
-            full_name = f"{prefix}{cat_name}" if prefix else cat_name
+    def _build_category_index(self, categories):
+        """
+        Build the normalized name index for categories
 
-            # Normalize category name for comparison
-            normalized_cat_name = self._normalize_text(cat_name)
+        Walks the tree with an explicit stack of iterators instead of
+        recursing, keeping depth-first order.
 
-            # Check if category name matches
-            if normalized_search in normalized_cat_name:
-                cat_path = f"cat:{full_name.replace('/', ':')}"
-                matching_categories.append((cat_name, cat_path, "Category"))
+        Args:
+            categories: Categories dictionary
 
-            # Search in subcategories recursively
-            subcategories = cat_info.get("subcategories", {})
-            if subcategories:
-                sub_matches = self._find_matching_categories(
-                    normalized_search,
-                    subcategories,
-                    f"{full_name}/"
-                )
-                matching_categories.extend(sub_matches)
+        Returns:
+            List of tuples (normalized_name, category_name, category_path)
+        """
+        normalize = self._normalize_text
+        entries = []
+        stack = [(iter(categories.items()), "cat:")]
+
+        while stack:
+            items, path_prefix = stack[-1]
+            for cat_name, cat_info in items:
+                cat_path = path_prefix + cat_name.replace('/', ':')
+                entries.append((normalize(cat_name), cat_name, cat_path))
+
+                # Descend into subcategories before the next sibling
+                subcategories = cat_info.get("subcategories")
+                if subcategories:
+                    stack.append((iter(subcategories.items()), cat_path + ":"))
+                    break
+            else:
+                stack.pop()
+
+        return entries
+
+    def _detach_columns(self):
+        """
+        Remove the current columns from the window
+
+        The first time results replace the browsing columns, those columns are
+        kept so clearing the search can put them back instead of rebuilding.
+        """
+        window = self.window
+        if self._saved_columns is None:
+            self._saved_columns = list(window.columns)
+            self._saved_revision = self._columns_revision()
+            discarded = ()
+        else:
+            # Previous results are dropped along with any chunks of a large
+            # result set still queued for idle insertion
+            discarded = window.columns
 
-        return matching_categories
+        for column in discarded:
+            column.cancel_populate()
+        for column in window.columns:
+            window.columns_box.remove(column)
+        window.columns.clear()
 
-    def _get_projects_from_categories(self, matching_categories):
+    def _columns_revision(self):
         """
-        Get all projects that belong to the matching categories
+        Config state the browsing columns were rendered from
 
-        Args:
-            matching_categories: List of tuples (category_name, category_path, type)
+        Returns:
+            Tuple of the data revision and the favorites revision (the
+            columns show favorite stars and ordering)
+        """
+        config = self.window.config
+        return (getattr(config, 'revision', None), getattr(config, 'favorites_revision', None))
+
+    def _restore_saved_columns(self):
+        """
+        Put back the browsing columns detached by _detach_columns
 
         Returns:
-            List of tuples (project_name, project_path, category)
+            True if the columns were restored, False if there was nothing to
+            restore or the data or favorites changed since they were built
         """
-        category_projects = []
-
-        # Extract category paths from matching categories
-        category_paths = []
-        for cat_name, cat_path, cat_type in matching_categories:
-            # Remove "cat:" prefix and convert to category path format
-            if cat_path.startswith("cat:"):
-                clean_path = cat_path[4:]  # Remove "cat:"
-                category_paths.append(clean_path)
-
-        # Find all projects that belong to these categories
-        for project_name, project_info in self.window.projects.items():
-            if isinstance(project_info, dict):
-                project_category = project_info.get('category', '')
-                project_subcategory = project_info.get('subcategory', '')
-
-                # Build full project category path
-                if project_subcategory:
-                    full_project_path = f"{project_category}:{project_subcategory}"
-                else:
-                    full_project_path = project_category
-
-                # Check if project belongs to any of the matching categories
-                for cat_path in category_paths:
-                    # Convert "/" to ":" for comparison
-                    cat_path_normalized = cat_path.replace("/", ":")
-
-                    # Check if project belongs to this category or any subcategory
-                    if full_project_path == cat_path_normalized or full_project_path.startswith(cat_path_normalized + ":"):
-                        category_projects.append((
-                            project_name,
-                            project_info.get("path", ""),
-                            project_info.get("category", "Others")
-                        ))
-                        break  # Don't add the same project multiple times
-
-        return category_projects
+        saved_columns = self._saved_columns
+        self._saved_columns = None
+        window = self.window
+        if saved_columns is None:
+            return False
+        if self._columns_revision() != self._saved_revision:
+            # Stale columns are dropped; the caller reloads the interface
+            for column in saved_columns:
+                column.cancel_populate()
+            return False
+
+        for column in window.columns:
+            column.cancel_populate()
+            window.columns_box.remove(column)
+        window.columns[:] = saved_columns
+        for column in saved_columns:
+            window.columns_box.pack_start(column, True, True, 1)
+        return True
 
     def show_search_results(self, projects, files, categories):
         """
@@ -234,9 +328,7 @@ class SearchManager:
             categories: List of tuples (category_name, category_path, type)
         """
         # Clear existing columns
-        for column in self.window.columns:
-            self.window.columns_box.remove(column)
-        self.window.columns.clear()
+        self._detach_columns()
 
         # Create results column manually (don't use add_column)
         from src.ui.column_browser import ColumnBrowser
@@ -248,42 +340,46 @@ class SearchManager:
         )
         results_column.current_path = "search_results"
         results_column.store.clear()
+        rows = []
+        # One favorites read per render instead of one per row
+        favorites = self.window.config.get_favorites_set()
 
         # Add categories first (sorted alphabetically)
         sorted_categories = sorted(categories, key=lambda x: x[0].lower())
         for cat_name, cat_path, cat_type in sorted_categories:
-            is_fav = self.window.config.is_favorite(cat_path, "category")
-            results_column.store.append([f"📁 {cat_name}", cat_path, True, "folder", is_fav, False])
+            is_fav = (cat_path, "category") in favorites
+            rows.append((_CATEGORY_LABEL + cat_name, cat_path, True, "folder", is_fav, False))
 
         # Add projects (sorted alphabetically)
         sorted_projects = sorted(projects, key=lambda x: x[0].lower())
         for project_name, project_path, category in sorted_projects:
-            is_fav = self.window.config.is_favorite(project_path, "project")
-            results_column.store.append([f"📄 {project_name}", project_path, True, "code", is_fav, False])
+            is_fav = (project_path, "project") in favorites
+            rows.append((_ITEM_LABEL + project_name, project_path, True, "code", is_fav, False))
 
         # Add files (sorted alphabetically)
         sorted_files = sorted(files, key=lambda x: x[0].lower())
         for file_name, file_path, category in sorted_files:
-            is_fav = self.window.config.is_favorite(file_path, "file")
-            results_column.store.append([f"📄 {file_name}", file_path, True, "text-x-generic", is_fav, False])
+            is_fav = (file_path, "file") in favorites
+            rows.append((_ITEM_LABEL + file_name, file_path, True, "text-x-generic", is_fav, False))
 
         # If no results, show message
-        if not projects and not files and not categories:
-            results_column.store.append(["No results found", "", False, "dialog-information", False, False])
+        if not rows:
+            rows.append(("No results found", "", False, "dialog-information", False, False))
+
+        # Bulk insert with the model detached instead of one append per row
+        results_column._populate(rows)
 
         # Add column to interface
         self.window.columns.append(results_column)
         self.window.columns_box.pack_start(results_column, True, True, 1)
-        results_column.show_all()
+        results_column.show()
 
     def show_recent_items(self):
         """Display recently opened items"""
         recents = self.window.config.load_recents()
 
         # Clear existing columns
-        for column in self.window.columns:
-            self.window.columns_box.remove(column)
-        self.window.columns.clear()
+        self._detach_columns()
 
         # Create results column
         from src.ui.column_browser import ColumnBrowser
@@ -297,19 +393,24 @@ class SearchManager:
         results_column.store.clear()
 
         if not recents:
-            results_column.store.append(["No recent items", "", False, "dialog-information", False, False])
+            rows = [("No recent items", "", False, "dialog-information", False, False)]
         else:
+            rows = []
+            favorites = self.window.config.get_favorites_set()
             for item in recents:
                 item_name = item.get("name", "Unknown")
                 item_path = item.get("path", "")
                 item_type = item.get("type", "project")
 
                 icon = "text-x-generic" if item_type == "file" else "code"
-                is_fav = self.window.config.is_favorite(item_path, item_type)
+                favorite_type = item_type if item_type in ("category", "file") else "project"
+                is_fav = (item_path, favorite_type) in favorites
+
+                rows.append((item_name, item_path, True, icon, is_fav, False))
 
-                results_column.store.append([item_name, item_path, True, icon, is_fav, False])
+        results_column._populate(rows)
 
         # Add column to interface
         self.window.columns.append(results_column)
         self.window.columns_box.pack_start(results_column, True, True, 1)
-        results_column.show_all()
+        results_column.show()
@@ -12,8 +12,9 @@ import logging
 
 from src.core.config import ConfigManager
 from src.ui.search_manager import SearchManager
-from src.ui.keyboard_handler import KeyboardHandler
+from src.ui.keyboard_handler import KeyboardHandler, KEYBOARD_DEBOUNCE_MS
 from src.ui.navigation_manager import NavigationManager
+from src.ui.column_browser import path_from_dropped_uri
 from utils import open_project_in_vscode
 
 logger = logging.getLogger(__name__)
@@ -56,10 +57,13 @@ class FinderStyleWindow(Gtk.Window):
         self.default_editor = preferences.get("default_editor", "kiro")
         self.default_text_editor = preferences.get("default_text_editor", "gnome-text-editor")
         self.close_on_open = preferences.get("close_on_open", False)
+        self.keyboard_debounce_ms = KEYBOARD_DEBOUNCE_MS  # Minimum interval between repeated arrow-key moves
 
         # Interface state
         self.columns = []
         self.selected_path = None
+        self.focused_column = None  # Column whose tree view has focus, kept by ColumnBrowser
+        self.search_entry = None  # Created in setup_ui
 
         # Initialize managers
         self.search_manager = SearchManager(self)
@@ -220,21 +224,18 @@ class FinderStyleWindow(Gtk.Window):
 
             # Process each dropped item
             for uri in uris:
-                # Convert URI to path
-                if uri.startswith('file://'):
-                    path = uri[7:]  # Remove 'file://' prefix
-                    # Decode URL encoding
-                    import urllib.parse
-                    path = urllib.parse.unquote(path)
-
-                    logger.info(f"Processing dropped item: {path}")
-
-                    if os.path.isdir(path):
-                        self._add_project_from_drop(path, pre_config)
-                    elif os.path.isfile(path):
-                        self._add_file_from_drop(path, pre_config)
-                    else:
-                        logger.warning(f"Dropped item is neither file nor directory: {path}")
+                path = path_from_dropped_uri(uri)
+                if path is None:
+                    continue
+
+                logger.info(f"Processing dropped item: {path}")
+
+                if os.path.isdir(path):
+                    self._add_project_from_drop(path, pre_config)
+                elif os.path.isfile(path):
+                    self._add_file_from_drop(path, pre_config)
+                else:
+                    logger.warning(f"Dropped item is neither file nor directory: {path}")
 
             Gtk.drag_finish(context, True, False, time)
 
@@ -16,6 +16,7 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk
 
+from ui import column_browser
 from ui.column_browser import ColumnBrowser
 
 
@@ -277,6 +278,10 @@ class TestColumnBrowserHelperMethodsIntegration(unittest.TestCase):
         self.callback = Mock()
         self.browser = ColumnBrowser(self.callback)
 
+    def test_selection_is_the_treeview_selection(self):
+        """Test that the cached selection is the tree view's own TreeSelection"""
+        self.assertIs(self.browser.selection, self.browser.treeview.get_selection())
+
     def test_is_root_column_and_get_hierarchy_info_consistency(self):
         """Test that is_root_column and get_hierarchy_info are consistent"""
         # Test root column scenarios
@@ -335,5 +340,353 @@ class TestColumnBrowserHelperMethodsIntegration(unittest.TestCase):
             self.assertEqual(info['subcategory_path'], test_case['subcategory'])
 
 
+class TestColumnBrowserParsedPath(unittest.TestCase):
+    """Test cases for the cached current_path parse"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.callback = Mock()
+        self.browser = ColumnBrowser(self.callback)
+
+    def test_reassigning_current_path_invalidates_cached_parse(self):
+        """Test that setting current_path drops the previously parsed hierarchy"""
+        self.browser.current_path = "cat:Web:Frontend"
+        self.assertEqual(self.browser.get_hierarchy_info()['category'], "Web")
+
+        self.browser.current_path = "cat:Mobile"
+        info = self.browser.get_hierarchy_info()
+        self.assertEqual(info['level'], 1)
+        self.assertEqual(info['category'], "Mobile")
+        self.assertIsNone(info['subcategory_path'])
+
+    def test_non_category_paths_stay_at_root_level(self):
+        """Test that search, empty and directory columns report level 0"""
+        for path in ["search_results", "recent_items", "empty", "/home/user", "projects:categories"]:
+            self.browser.current_path = path
+            info = self.browser.get_hierarchy_info()
+            self.assertEqual(info['level'], 0)
+            self.assertIsNone(info['category'])
+
+    def test_pre_config_for_drop_uses_first_subcategory(self):
+        """Test that drop pre-config extracts category and first subcategory"""
+        self.browser.current_path = None
+        self.assertIsNone(self.browser._get_pre_config_for_drop())
+
+        self.browser.current_path = "cat:Work"
+        self.assertEqual(self.browser._get_pre_config_for_drop(),
+                         {'category': "Work", 'subcategory': None})
+
+        self.browser.current_path = "cat:Work:Backend:API"
+        self.assertEqual(self.browser._get_pre_config_for_drop(),
+                         {'category': "Work", 'subcategory': "Backend"})
+
+        self.browser.current_path = "projects:cat:Work"
+        self.assertIsNone(self.browser._get_pre_config_for_drop())
+
+
+class TestColumnBrowserFindItemIter(unittest.TestCase):
+    """Test cases for find_item_iter method"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.callback = Mock()
+        self.browser = ColumnBrowser(self.callback)
+        self.browser.load_mixed_content(
+            {"Web": {"subcategories": {"Frontend": {}, "Backend": {}}}},
+            "cat:Web",
+            {"site": {"path": "/home/user/site", "category": "Web"}},
+            {}
+        )
+
+    def test_find_item_iter_returns_matching_row(self):
+        """Test that find_item_iter locates rows loaded through _populate"""
+        for path in ["cat:Web:Backend", "cat:Web:Frontend", "/home/user/site"]:
+            iter = self.browser.find_item_iter(path)
+            self.assertIsNotNone(iter)
+            self.assertEqual(self.browser.store.get_value(iter, 1), path)
+
+    def test_find_item_iter_returns_none_for_unknown_path(self):
+        """Test that find_item_iter returns None when the path isn't listed"""
+        self.assertIsNone(self.browser.find_item_iter("cat:Web:Mobile"))
+
+    def test_find_item_iter_handles_rows_added_outside_loaders(self):
+        """Test that find_item_iter still finds rows appended directly to the store"""
+        self.browser.store.clear()
+        self.browser.store.append(["Extra", "/home/user/extra", True, "code", False, False])
+
+        self.assertIsNone(self.browser.find_item_iter("/home/user/site"))
+        iter = self.browser.find_item_iter("/home/user/extra")
+        self.assertEqual(self.browser.store.get_value(iter, 0), "Extra")
+
+
+class TestClassifyItem(unittest.TestCase):
+    """Test cases for the classify_item helper"""
+
+    def test_classify_item(self):
+        """Test that items are classified by path prefix and icon"""
+        self.assertEqual(column_browser.classify_item("cat:Web", "folder"), "category")
+        self.assertEqual(column_browser.classify_item("/tmp/notes.txt", "text-x-generic"), "file")
+        self.assertEqual(column_browser.classify_item("/tmp/project", "code"), "project")
+
+
+class TestLevelFilter(unittest.TestCase):
+    """Test cases for the _level_filter helper"""
+
+    def test_root_level_keeps_everything(self):
+        """Test that the root level doesn't filter on subcategory"""
+        belongs = column_browser._level_filter(None, None)
+        self.assertTrue(belongs(None))
+        self.assertTrue(belongs("Frontend"))
+
+    def test_category_level_keeps_items_without_subcategory(self):
+        """Test that a category level only lists items without subcategory"""
+        belongs = column_browser._level_filter("Web", None)
+        self.assertTrue(belongs(None))
+        self.assertTrue(belongs(""))
+        self.assertFalse(belongs("Frontend"))
+
+    def test_subcategory_level_keeps_matching_and_nested_items(self):
+        """Test that a subcategory level lists its own and nested items"""
+        belongs = column_browser._level_filter("Web", "Frontend")
+        self.assertTrue(belongs("Frontend"))
+        self.assertTrue(belongs("Frontend:React"))
+        self.assertFalse(belongs("FrontendOld"))
+        self.assertFalse(belongs(None))
+
+
+class TestPathFromDroppedUri(unittest.TestCase):
+    """Test cases for the path_from_dropped_uri helper"""
+
+    def setUp(self):
+        """Patch GLib with a converter that rejects malformed URIs"""
+        class GLibError(Exception):
+            pass
+
+        def filename_from_uri(uri):
+            if "%" in uri:
+                raise GLibError("invalid escape")
+            return (uri[len("file://"):], None)
+
+        patcher = patch.object(column_browser, 'GLib', Mock(Error=GLibError, filename_from_uri=filename_from_uri))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_file_uri_is_converted(self):
+        """Test that file URIs are converted to local paths"""
+        self.assertEqual(column_browser.path_from_dropped_uri("file:///home/user/app"), "/home/user/app")
+
+    def test_other_and_malformed_uris_are_skipped(self):
+        """Test that non-file URIs and URIs GLib rejects give None"""
+        self.assertIsNone(column_browser.path_from_dropped_uri("https://example.com/app"))
+        self.assertIsNone(column_browser.path_from_dropped_uri("file:///home/user/%zz"))
+
+
+class TestColumnBrowserLoadHierarchyRoot(unittest.TestCase):
+    """Test cases for the root level of load_hierarchy_level"""
+
+    def test_root_lists_items_without_category(self):
+        """Test that only items with no category at all are listed at the root"""
+        browser = ColumnBrowser(Mock())
+        browser.load_hierarchy_level(
+            {"Web": {}},
+            None,
+            {
+                "plain": "/home/user/plain",
+                "uncategorized": {"path": "/home/user/uncategorized", "category": None},
+                "blank": {"path": "/home/user/blank", "category": ""},
+                "site": {"path": "/home/user/site", "category": "Web"},
+            },
+            {"notes": {"path": "/home/user/notes.txt"}}
+        )
+
+        self.assertEqual(
+            [row[1] for row in browser.store],
+            ["cat:Web", "/home/user/plain", "/home/user/uncategorized", "/home/user/notes.txt"]
+        )
+
+
+class TestColumnBrowserSetItemFavorite(unittest.TestCase):
+    """Test cases for set_item_favorite method"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.callback = Mock()
+        self.browser = ColumnBrowser(self.callback)
+        self.browser.load_mixed_content(
+            {"Web": {"subcategories": {"Backend": {}, "Frontend": {}}}},
+            "cat:Web",
+            {
+                "alpha": {"path": "/home/user/alpha", "category": "Web"},
+                "beta": {"path": "/home/user/beta", "category": "Web"},
+            },
+            {"notes": {"path": "/home/user/notes.txt", "category": "Web"}}
+        )
+
+    def _names(self):
+        return [row[0] for row in self.browser.store]
+
+    def test_favorite_moves_to_top_of_its_group(self):
+        """Test that a new favorite moves ahead of its group but not past other groups"""
+        iter = self.browser.find_item_iter("/home/user/beta")
+        self.browser.set_item_favorite(iter, True)
+
+        self.assertEqual(self._names(), ["Backend", "Frontend", "beta", "alpha", "notes"])
+        self.assertTrue(self.browser.store.get_value(iter, 4))
+
+    def test_unfavorite_returns_to_alphabetical_slot(self):
+        """Test that removing a favorite puts the row back in name order"""
+        iter = self.browser.find_item_iter("cat:Web:Frontend")
+        self.browser.set_item_favorite(iter, True)
+        self.assertEqual(self._names()[:2], ["Frontend", "Backend"])
+
+        self.browser.set_item_favorite(iter, False)
+        self.assertEqual(self._names(), ["Backend", "Frontend", "alpha", "beta", "notes"])
+
+    def test_path_index_follows_moved_rows(self):
+        """Test that the path -> row index stays in sync after a move"""
+        iter = self.browser.find_item_iter("/home/user/beta")
+        self.browser.set_item_favorite(iter, True)
+
+        expected = {row[1]: index for index, row in enumerate(self.browser.store)}
+        self.assertEqual(self.browser._path_to_row, expected)
+
+    def test_row_stays_while_chunks_are_pending(self):
+        """Test that a row isn't moved while the column is still being filled"""
+        self.browser._populate_source = 1
+        iter = self.browser.find_item_iter("/home/user/beta")
+        self.browser.set_item_favorite(iter, True)
+
+        self.assertEqual(self._names(), ["Backend", "Frontend", "alpha", "beta", "notes"])
+        self.assertTrue(self.browser.store.get_value(iter, 4))
+        self.browser._populate_source = None
+
+
+class _IdleQueue:
+    """Stand-in for GLib's idle sources that runs callbacks on demand"""
+
+    PRIORITY_HIGH_IDLE = 100
+
+    def __init__(self):
+        self.sources = {}
+        self._next_id = 1
+
+    def idle_add(self, func, *args, priority=None):
+        source_id = self._next_id
+        self._next_id += 1
+        self.sources[source_id] = (func, args)
+        return source_id
+
+    def source_remove(self, source_id):
+        return self.sources.pop(source_id, None) is not None
+
+    def drain(self):
+        """Run idle callbacks until every source has finished"""
+        while self.sources:
+            source_id, (func, args) = next(iter(self.sources.items()))
+            if not func(*args):
+                self.sources.pop(source_id, None)
+
+
+class TestColumnBrowserChunkedPopulate(unittest.TestCase):
+    """Test cases for _populate inserting large columns in idle-time chunks"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.idle = _IdleQueue()
+        patcher = patch.object(column_browser, 'GLib', self.idle)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.callback = Mock()
+        self.browser = ColumnBrowser(self.callback)
+        self.count = column_browser._POPULATE_CHUNK * 2 + 50
+        self.rows = [
+            (f"project{i:04d}", f"/home/user/project{i:04d}", True, "code", False, False)
+            for i in range(self.count)
+        ]
+
+    def _row_count(self):
+        return self.browser.store.iter_n_children(None)
+
+    def test_first_chunk_is_inserted_synchronously(self):
+        """Test that only the first chunk lands before the main loop runs"""
+        self.browser._populate(self.rows)
+
+        self.assertEqual(self._row_count(), column_browser._POPULATE_CHUNK)
+        self.assertEqual(len(self.idle.sources), 1)
+        self.assertIsNotNone(self.browser.find_item_iter("/home/user/project0000"))
+        # Rows still queued aren't found yet, even though they're indexed
+        self.assertIsNone(self.browser.find_item_iter(self.rows[-1][1]))
+
+    def test_draining_idle_completes_store_and_index(self):
+        """Test that the idle chunks insert every remaining row in order"""
+        self.browser._populate(self.rows)
+        self.idle.drain()
+
+        self.assertEqual(self._row_count(), self.count)
+        self.assertEqual([row[1] for row in self.browser.store], [row[1] for row in self.rows])
+        self.assertEqual(len(self.browser._path_to_row), self.count)
+        self.assertEqual(self.browser._path_to_row[self.rows[-1][1]], self.count - 1)
+
+        iter = self.browser.find_item_iter(self.rows[-1][1])
+        self.assertEqual(self.browser.store.get_value(iter, 0), self.rows[-1][0])
+        self.assertIsNone(self.browser._populate_source)
+
+    def test_idle_chunks_restamp_content_version(self):
+        """Test that rows appended from idle change the column's content version"""
+        self.browser._populate(self.rows)
+        version = self.browser.content_version
+
+        self.idle.drain()
+
+        self.assertNotEqual(self.browser.content_version, version)
+
+    def test_reload_cancels_stale_chunks(self):
+        """Test that a load in between drops the rows queued by the previous load"""
+        self.browser._populate(self.rows)
+        self.browser.load_projects_at_level(
+            "cat:Web", {"site": {"path": "/home/user/site", "category": "Web"}}
+        )
+        self.idle.drain()
+
+        self.assertEqual([row[1] for row in self.browser.store], ["/home/user/site"])
+        self.assertEqual(self.browser._path_to_row, {"/home/user/site": 0})
+
+    def test_clear_items_cancels_pending_chunks(self):
+        """Test that clearing the column removes the queued idle source"""
+        self.browser._populate(self.rows)
+        self.browser.clear_items()
+
+        self.assertEqual(self.idle.sources, {})
+        self.assertIsNone(self.browser._populate_source)
+        self.assertEqual(self.browser._path_to_row, {})
+
+        # Rows added afterwards aren't followed by the old queue
+        self.browser.store.append(self.rows[0])
+        self.idle.drain()
+        self.assertEqual(self._row_count(), 1)
+
+    def test_destroy_cancels_pending_chunks(self):
+        """Test that destroying the column removes the queued idle source"""
+        self.browser._populate(self.rows)
+        self.browser._on_destroy(self.browser)
+
+        self.assertEqual(self.idle.sources, {})
+        self.assertIsNone(self.browser._populate_source)
+
+    def test_missing_directory_resets_index(self):
+        """Test that loading a missing directory drops queued rows and the path index"""
+        self.browser._populate(self.rows)
+        version = self.browser.content_version
+
+        self.browser.load_directory("/nonexistent/path/for/test")
+        self.idle.drain()
+
+        self.assertEqual(self._row_count(), 0)
+        self.assertEqual(self.browser._path_to_row, {})
+        self.assertNotEqual(self.browser.content_version, version)
+        self.assertIsNone(self.browser.find_item_iter(self.rows[0][1]))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -61,6 +61,22 @@ class TestColumnBrowserContextMenuIntegration(unittest.TestCase):
         # Verify treeview exists and is a TreeView
         self.assertIsInstance(browser.treeview, Gtk.TreeView)
 
+    def test_context_menu_handler_created_lazily(self):
+        """Test that the handler is only built once a right-click needs it"""
+        browser = ColumnBrowser(self.callback, parent_window=self.parent_window)
+        self.assertIsNone(browser._context_menu_handler)
+
+        # Left-clicks don't build the handler
+        event = Mock()
+        event.button = 1
+        self.assertFalse(browser._on_button_press(browser.treeview, event))
+        self.assertIsNone(browser._context_menu_handler)
+
+        # First access builds it once and reuses it afterwards
+        handler = browser.context_menu_handler
+        self.assertIsInstance(handler, ContextMenuHandler)
+        self.assertIs(browser.context_menu_handler, handler)
+
     def test_column_browser_stores_parent_window_reference(self):
         """Test that ColumnBrowser stores reference to parent_window"""
         # Create ColumnBrowser with parent_window
@@ -11,7 +11,7 @@ from unittest.mock import patch
 import pytest
 from hypothesis import given, strategies as st, settings
 
-from src.core.config import ConfigManager
+from src.core.config import ConfigManager, RevisionCache
 
 
 class TestConfigManagerTerminalPreferences:
@@ -757,4 +757,98 @@ class TestConfigManagerProperties:
             assert isinstance(file_content, dict), \
                 "Saved file should contain valid JSON dictionary"
         except json.JSONDecodeError:
-            pytest.fail("After handling corruption, file should contain valid JSON")
\ No newline at end of file
+            pytest.fail("After handling corruption, file should contain valid JSON")
+
+
+class TestConfigManagerRevision:
+    """Test the data revision counter used to invalidate in-memory indexes"""
+
+    def setup_method(self):
+        """Set up test environment with temporary config directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.patches = [
+            patch('src.core.config.CONFIG_DIR', self.temp_dir),
+            patch('src.core.config.CATEGORIES_FILE', os.path.join(self.temp_dir, "categories.json")),
+            patch('src.core.config.PROJECTS_FILE', os.path.join(self.temp_dir, "projects.json")),
+            patch('src.core.config.FILES_FILE', os.path.join(self.temp_dir, "files.json")),
+            patch('src.core.config.FAVORITES_FILE', os.path.join(self.temp_dir, "favorites.json")),
+        ]
+        for p in self.patches:
+            p.start()
+
+        self.config_manager = ConfigManager()
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_saving_data_bumps_revision(self):
+        """Test that saving categories, projects or files bumps the revision"""
+        revision = self.config_manager.revision
+
+        self.config_manager.save_categories({"Work": {}})
+        assert self.config_manager.revision == revision + 1
+
+        self.config_manager.save_projects({"app": {"path": "/tmp/app", "category": "Work"}})
+        assert self.config_manager.revision == revision + 2
+
+        self.config_manager.save_files({"notes": {"path": "/tmp/notes.txt"}})
+        assert self.config_manager.revision == revision + 3
+
+    def test_saving_favorites_bumps_only_favorites_revision(self):
+        """Test that favorite toggles leave the data revision alone"""
+        revision = self.config_manager.revision
+        favorites_revision = self.config_manager.favorites_revision
+
+        self.config_manager.toggle_favorite("/tmp/app", "project")
+
+        assert self.config_manager.revision == revision
+        assert self.config_manager.favorites_revision == favorites_revision + 1
+
+    def test_favorites_set_matches_is_favorite(self):
+        """Test that the favorites snapshot agrees with is_favorite"""
+        self.config_manager.toggle_favorite("/tmp/app", "project")
+        self.config_manager.toggle_favorite("/tmp/notes.txt", "file")
+        self.config_manager.toggle_favorite("cat:Work", "category")
+
+        favorites = self.config_manager.get_favorites_set()
+
+        assert favorites == {
+            ("/tmp/app", "project"),
+            ("/tmp/notes.txt", "file"),
+            ("cat:Work", "category"),
+        }
+        assert ("/tmp/app", "file") not in favorites
+
+    def test_loading_data_keeps_revision(self):
+        """Test that loading data doesn't bump the revision"""
+        self.config_manager.save_projects({"app": "/tmp/app"})
+        revision = self.config_manager.revision
+
+        self.config_manager.load_projects()
+        self.config_manager.load_files()
+
+        assert self.config_manager.revision == revision
+
+    def test_revision_cache_rebuilds_after_save(self):
+        """Test that cached values are rebuilt when the source changes or is saved"""
+        cache = RevisionCache()
+        projects = {"app": "/tmp/app"}
+        builds = []
+
+        def build(source):
+            builds.append(source)
+            return sorted(source)
+
+        assert cache.get(projects, self.config_manager, build) == ["app"]
+        assert cache.get(projects, self.config_manager, build) == ["app"]
+        assert len(builds) == 1
+
+        projects["lib"] = "/tmp/lib"
+        assert cache.get(projects, self.config_manager, build) == ["app", "lib"]
+
+        self.config_manager.save_projects(projects)
+        cache.get(projects, self.config_manager, build)
+        assert len(builds) == 3
\ No newline at end of file
@@ -11,6 +11,7 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.ui import keyboard_handler
 from src.ui.keyboard_handler import KeyboardHandler
 
 
@@ -36,10 +37,10 @@ class TestKeyboardNavigation(unittest.TestCase):
 
         mock_column.treeview = mock_treeview
         mock_treeview.has_focus.return_value = True
-        mock_treeview.get_selection.return_value = mock_selection
+        mock_column.selection = mock_selection
         mock_selection.get_selected.return_value = (mock_store, mock_iter)
         mock_store.get_path.return_value = mock_path
-        mock_path.get_indices.return_value = [0]  # First item (index 0)
+        mock_store.iter_previous.return_value = None  # First item, nothing above
 
         self.window.columns = [mock_column]
         self.window.search_entry.has_focus.return_value = False
@@ -64,7 +65,7 @@ class TestKeyboardNavigation(unittest.TestCase):
         mock_iter = Mock()
 
         mock_column.treeview = mock_treeview
-        mock_treeview.get_selection.return_value = mock_selection
+        mock_column.selection = mock_selection
         mock_selection.get_selected.return_value = (mock_store, None)  # No selection
         mock_column.store = mock_store
         mock_store.get_iter_first.return_value = mock_iter
@@ -90,7 +91,7 @@ class TestKeyboardNavigation(unittest.TestCase):
 
         mock_column.treeview = mock_treeview
         mock_treeview.has_focus.return_value = True
-        mock_treeview.get_selection.return_value = mock_selection
+        mock_column.selection = mock_selection
         mock_selection.get_selected.return_value = (mock_store, None)  # No selection
         mock_store.get_iter_first.return_value = mock_iter
         mock_store.get_path.return_value = Mock()
@@ -115,7 +116,7 @@ class TestKeyboardNavigation(unittest.TestCase):
 
         mock_column.treeview = mock_treeview
         mock_treeview.has_focus.return_value = True
-        mock_treeview.get_selection.return_value = mock_selection
+        mock_column.selection = mock_selection
         mock_selection.get_selected.return_value = (mock_store, None)  # No selection
         mock_store.get_iter_first.return_value = mock_iter
         mock_store.get_path.return_value = Mock()
@@ -146,7 +147,7 @@ class TestKeyboardNavigation(unittest.TestCase):
 
         mock_treeview1.has_focus.return_value = True
         mock_treeview2.has_focus.return_value = False
-        mock_treeview2.get_selection.return_value = mock_selection2
+        mock_column2.selection = mock_selection2
         mock_selection2.get_selected.return_value = (mock_store2, None)  # No selection
         mock_column2.store = mock_store2
         mock_store2.get_iter_first.return_value = mock_iter2
@@ -160,6 +161,211 @@ class TestKeyboardNavigation(unittest.TestCase):
         mock_treeview2.grab_focus.assert_called_once()
         mock_selection2.select_iter.assert_called_once_with(mock_iter2)
 
+    def test_focused_column_uses_cached_column(self):
+        """Test that the column recorded on focus-in is used without probing tree views"""
+        mock_column1 = Mock()
+        mock_column2 = Mock()
+        self.window.columns = [mock_column1, mock_column2]
+        self.window.focused_column = mock_column2
+
+        self.assertEqual(self.handler._get_focused_column(), (1, mock_column2))
+        mock_column1.treeview.has_focus.assert_not_called()
+        mock_column2.treeview.has_focus.assert_not_called()
+
+    def test_focused_column_none_when_nothing_focused(self):
+        """Test that no column is reported when focus is elsewhere"""
+        mock_column = Mock()
+        mock_column.treeview.has_focus.return_value = False
+        self.window.columns = [mock_column]
+        self.window.focused_column = None
+
+        self.assertEqual(self.handler._get_focused_column(), (None, None))
+
+    def test_focused_column_falls_back_to_has_focus(self):
+        """Test that tree views are probed when no focus-in was recorded"""
+        mock_column1 = Mock()
+        mock_column2 = Mock()
+        mock_column1.treeview.has_focus.return_value = False
+        mock_column2.treeview.has_focus.return_value = True
+        self.window.columns = [mock_column1, mock_column2]
+        self.window.focused_column = None
+
+        self.assertEqual(self.handler._get_focused_column(), (1, mock_column2))
+
+    def test_selected_item_prefers_focused_column(self):
+        """Test that the focused column's selection is used without scanning the others"""
+        mock_column1 = Mock()
+        mock_column2 = Mock()
+        model = Mock()
+        model.get_value.side_effect = lambda it, col: {1: "/tmp/project", 3: "code"}[col]
+        mock_iter = Mock()
+        mock_column1.selection.get_selected.return_value = (model, mock_iter)
+        self.window.columns = [mock_column1, mock_column2]
+        self.window.focused_column = mock_column1
+
+        result = self.handler._get_selected_item()
+
+        self.assertEqual(result, (mock_column1, mock_iter, "/tmp/project", "project"))
+        mock_column2.selection.get_selected.assert_not_called()
+
+    def test_breadcrumb_trail_skips_unchanged_state(self):
+        """Test that the breadcrumb trail is only redrawn when its inputs change"""
+        mock_column1 = Mock()
+        mock_column2 = Mock()
+        mock_column1.content_version = 1
+        mock_column2.content_version = 2
+        self.window.columns = [mock_column1, mock_column2]
+        self.window.focused_column = mock_column2
+        self.handler.column_selections = {0: "0"}
+
+        self.handler._update_breadcrumb_trail()
+        self.handler._update_breadcrumb_trail()
+        self.assertEqual(mock_column1.clear_breadcrumb_trail.call_count, 1)
+
+        # Reloading a column invalidates the trail
+        mock_column1.content_version = 3
+        self.handler._update_breadcrumb_trail()
+        self.assertEqual(mock_column1.clear_breadcrumb_trail.call_count, 2)
+
+    def test_selection_restored_by_item_path(self):
+        """Test that a saved selection is found again by item path after a reload"""
+        mock_column = Mock()
+        mock_iter = Mock()
+        mock_column.selection.get_selected.return_value = (mock_column.store, mock_iter)
+        mock_column.store.get_value.return_value = "cat:Web"
+        self.window.columns = [mock_column]
+
+        self.handler._save_current_selection(0)
+        self.assertEqual(self.handler.column_selections[0], "cat:Web")
+
+        # Rows moved: the item is looked up again instead of reusing its old position
+        moved_iter = Mock()
+        mock_column.find_item_iter.return_value = moved_iter
+        self.assertTrue(self.handler._restore_selection(0))
+
+        mock_column.find_item_iter.assert_called_once_with("cat:Web")
+        mock_column.selection.select_iter.assert_called_once_with(moved_iter)
+
+    def test_navigate_down_moves_cursor_only(self):
+        """Test that down arrow relies on set_cursor to select the next row"""
+        mock_column = Mock()
+        mock_iter = Mock()
+        next_iter = Mock()
+        next_path = Mock()
+        mock_column.treeview.has_focus.return_value = True
+        mock_column.selection.get_selected.return_value = (mock_column.store, mock_iter)
+        mock_column.store.iter_next.return_value = next_iter
+        mock_column.store.get_path.return_value = next_path
+
+        self.window.columns = [mock_column]
+        self.window.search_entry.has_focus.return_value = False
+
+        self.handler._navigate_down()
+
+        mock_column.treeview.set_cursor.assert_called_once_with(next_path, None, False)
+        mock_column.selection.select_path.assert_not_called()
+        mock_column.treeview.scroll_to_cell.assert_not_called()
+
+
+class TestKeyPressDispatch(unittest.TestCase):
+    """Test on_key_press dispatch to shortcut handlers"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.Gdk = keyboard_handler.Gdk
+        # Plain int mask so the Ctrl check works with a mocked Gdk too
+        patcher = patch.object(keyboard_handler, '_CONTROL_MASK', 4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.window = Mock()
+        self.window.columns = []
+        self.handler = KeyboardHandler(self.window)
+
+    def _event(self, keyval, ctrl=False):
+        event = Mock()
+        event.keyval = keyval
+        event.state = 4 if ctrl else 0
+        return event
+
+    def test_escape_closes_window(self):
+        """Test that Escape destroys the window"""
+        result = self.handler.on_key_press(None, self._event(self.Gdk.KEY_Escape))
+
+        self.assertTrue(result)
+        self.window.destroy.assert_called_once()
+
+    def test_ctrl_f_focuses_search(self):
+        """Test that Ctrl+F moves focus to the search entry"""
+        result = self.handler.on_key_press(None, self._event(self.Gdk.KEY_f, ctrl=True))
+
+        self.assertTrue(result)
+        self.window.search_entry.grab_focus.assert_called_once()
+
+    def test_plain_keys_still_work_with_ctrl_held(self):
+        """Test that Escape is handled even when Ctrl is held"""
+        result = self.handler.on_key_press(None, self._event(self.Gdk.KEY_Escape, ctrl=True))
+
+        self.assertTrue(result)
+        self.window.destroy.assert_called_once()
+
+    def test_modifier_only_press_is_ignored(self):
+        """Test that pressing Ctrl on its own is passed through untouched"""
+        result = self.handler.on_key_press(None, self._event(self.Gdk.KEY_Control_L, ctrl=True))
+
+        self.assertFalse(result)
+        self.window.search_entry.grab_focus.assert_not_called()
+        self.window.destroy.assert_not_called()
+
+    def test_arrow_autorepeat_is_debounced(self):
+        """Test that repeated arrow presses inside the debounce window are dropped"""
+        self.window.keyboard_debounce_ms = 20
+        self.window.search_entry = None
+
+        handled_times = []
+        for event_time in (1000, 1010, 1025):
+            event = self._event(self.Gdk.KEY_Down)
+            event.time = event_time
+            self.assertTrue(self.handler.on_key_press(None, event))
+            handled_times.append(self.handler._last_nav_time)
+
+        # The press at 1010 ms falls inside the 20 ms window after 1000 ms
+        self.assertEqual(handled_times, [1000, 1000, 1025])
+
+    def test_default_debounce_limits_autorepeat(self):
+        """Test that the default interval drops presses at common autorepeat rates"""
+        self.window.keyboard_debounce_ms = keyboard_handler.KEYBOARD_DEBOUNCE_MS
+        self.window.search_entry = None
+
+        # GNOME repeats every 30 ms by default, X servers every 40 ms (25 Hz)
+        for repeat_interval in (30, 40):
+            navigate_down = Mock()
+            nav_handlers = KeyboardHandler._NAV_HANDLERS | {navigate_down}
+            with patch.dict(KeyboardHandler._KEY_HANDLERS, {(self.Gdk.KEY_Down, False): navigate_down}), \
+                    patch.object(KeyboardHandler, '_NAV_HANDLERS', nav_handlers):
+                for event_time in range(1000, 1600, repeat_interval):
+                    event = self._event(self.Gdk.KEY_Down)
+                    event.time = event_time
+                    self.assertTrue(self.handler.on_key_press(None, event))
+
+            presses = len(range(1000, 1600, repeat_interval))
+            self.assertLessEqual(navigate_down.call_count, presses // 2 + 1)
+            self.assertGreater(navigate_down.call_count, 1)
+
+    def test_arrow_without_timestamp_is_not_debounced(self):
+        """Test that synthesized arrow presses with time 0 are always handled"""
+        self.window.keyboard_debounce_ms = 20
+        self.window.search_entry = None
+
+        navigate_down = Mock()
+        nav_handlers = KeyboardHandler._NAV_HANDLERS | {navigate_down}
+        with patch.dict(KeyboardHandler._KEY_HANDLERS, {(self.Gdk.KEY_Down, False): navigate_down}), \
+                patch.object(KeyboardHandler, '_NAV_HANDLERS', nav_handlers):
+            for _ in range(3):
+                event = self._event(self.Gdk.KEY_Down)
+                event.time = 0
+                self.assertTrue(self.handler.on_key_press(None, event))
+
+        self.assertEqual(navigate_down.call_count, 3)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test column management in the navigation manager
+"""
+
+import unittest
+from unittest.mock import Mock, call
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ui.navigation_manager import NavigationManager
+
+
+class TestHandleCategorySelection(unittest.TestCase):
+    """Test trimming columns when a category is selected"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.window = Mock()
+        self.window.categories = {}
+        self.window.projects = {}
+        self.window.files = {}
+        self.columns = [Mock(current_path="categories")] + [Mock() for _ in range(4)]
+        self.window.columns = list(self.columns)
+        self.navigation_manager = NavigationManager(self.window)
+
+    def test_excess_columns_removed_in_one_batch(self):
+        """Test that columns past the selected level are removed last first in one batch"""
+        box = self.window.columns_box
+
+        self.navigation_manager._handle_category_selection("cat:Web")
+
+        self.assertEqual(self.window.columns, self.columns[:3])
+        self.assertEqual(box.mock_calls, [
+            call.freeze_child_notify(),
+            call.remove(self.columns[4]),
+            call.remove(self.columns[3]),
+            call.thaw_child_notify(),
+        ])
+        for column in self.columns[3:]:
+            column.cancel_populate.assert_called_once()
+        self.columns[2].cancel_populate.assert_not_called()
+
+    def test_no_removal_when_columns_fit(self):
+        """Test that nothing is removed when there are no excess columns"""
+        del self.window.columns[3:]
+
+        self.navigation_manager._handle_category_selection("cat:Web")
+
+        self.window.columns_box.remove.assert_not_called()
+        self.window.columns_box.freeze_child_notify.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
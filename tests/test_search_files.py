@@ -80,6 +80,144 @@ class TestSearchFiles(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0][0], "config.json")
 
+    def test_name_index_reused_between_searches(self):
+        """Test that item names are normalized once, not on every search"""
+        with patch.object(self.search_manager, '_normalize_text',
+                          wraps=self.search_manager._normalize_text) as normalize:
+            self.search_manager._find_matching_files("notes")
+            self.search_manager._find_matching_files("readme")
+
+        self.assertEqual(normalize.call_count, len(self.window.files))
+
+    def test_name_index_rebuilt_after_save(self):
+        """Test that a config save invalidates the name index"""
+        self.window.config.revision = 1
+        self.search_manager._find_matching_files("notes")
+
+        self.window.files["notes.txt"]["path"] = "/tmp/notes.txt"
+        self.window.config.revision = 2
+        results = self.search_manager._find_matching_files("notes")
+
+        self.assertEqual(results[0][1], "/tmp/notes.txt")
+
+    def test_extended_query_filters_previous_matches(self):
+        """Test that typing more characters narrows the previous matches"""
+        self.assertEqual(len(self.search_manager._find_matching_files("o")), 2)
+
+        results = self.search_manager._find_matching_files("no")
+        self.assertEqual([r[0] for r in results], ["notes.txt"])
+
+        # A query that doesn't extend the last one scans the whole index again
+        results = self.search_manager._find_matching_files("re")
+        self.assertEqual([r[0] for r in results], ["readme.md"])
+
+    def test_find_nested_matching_categories(self):
+        """Test that subcategories are matched with their full path"""
+        categories = {"Web": {"subcategories": {"Front-End": {}}}}
+
+        results = self.search_manager._find_matching_categories("frontend", categories)
+
+        self.assertEqual(results, [("Front-End", "cat:Web:Front-End", "Category")])
+
+    def test_clearing_search_restores_browsing_columns(self):
+        """Test that clearing the search re-packs the columns from before it"""
+        browsing_columns = [Mock(), Mock(), Mock()]
+        self.window.columns = list(browsing_columns)
+        self.window.config.revision = 1
+
+        self.search_manager._detach_columns()
+        self.window.columns.append(Mock())  # results column
+
+        entry = Mock()
+        entry.get_text.return_value = ""
+        self.search_manager.on_search_changed(entry)
+
+        self.assertEqual(self.window.columns, browsing_columns)
+        self.window.reload_interface.assert_not_called()
+
+    def test_clearing_search_reloads_after_favorite_toggle(self):
+        """Test that saved columns are dropped once a favorite was toggled"""
+        self.window.columns = [Mock()]
+        self.window.config.revision = 1
+        self.window.config.favorites_revision = 1
+        self.search_manager._detach_columns()
+        self.window.config.favorites_revision = 2
+
+        entry = Mock()
+        entry.get_text.return_value = ""
+        self.search_manager.on_search_changed(entry)
+
+        self.window.reload_interface.assert_called_once()
+
+    def test_new_results_discard_previous_results(self):
+        """Test that replaced result columns are emptied, browsing columns kept"""
+        browsing_column = Mock()
+        results_column = Mock()
+        self.window.columns = [browsing_column]
+
+        self.search_manager._detach_columns()
+        self.window.columns.append(results_column)
+        self.search_manager._detach_columns()
+
+        results_column.cancel_populate.assert_called_once()
+        browsing_column.cancel_populate.assert_not_called()
+        self.assertEqual(self.window.columns, [])
+
+    def test_clearing_search_cancels_result_chunks(self):
+        """Test that restoring the browsing columns stops queued result rows"""
+        browsing_column = Mock()
+        results_column = Mock()
+        self.window.columns = [browsing_column]
+        self.window.config.revision = 1
+
+        self.search_manager._detach_columns()
+        self.window.columns.append(results_column)
+        self.assertTrue(self.search_manager._restore_saved_columns())
+
+        results_column.cancel_populate.assert_called_once()
+        browsing_column.cancel_populate.assert_not_called()
+        self.window.columns_box.remove.assert_any_call(results_column)
+
+    def test_stale_saved_columns_cancel_their_chunks(self):
+        """Test that saved columns dropped after a config change stop their chunks"""
+        browsing_column = Mock()
+        self.window.columns = [browsing_column]
+        self.window.config.revision = 1
+        self.search_manager._detach_columns()
+        self.window.config.revision = 2
+
+        self.assertFalse(self.search_manager._restore_saved_columns())
+        browsing_column.cancel_populate.assert_called_once()
+
+    def test_clearing_search_reloads_after_config_change(self):
+        """Test that saved columns are dropped once the config has changed"""
+        self.window.columns = [Mock()]
+        self.window.config.revision = 1
+        self.search_manager._detach_columns()
+        self.window.config.revision = 2
+
+        entry = Mock()
+        entry.get_text.return_value = ""
+        self.search_manager.on_search_changed(entry)
+
+        self.window.reload_interface.assert_called_once()
+
+    def test_unchanged_search_text_is_ignored(self):
+        """Test that a repeated search-changed with the same text is skipped"""
+        entry = Mock()
+        entry.get_text.return_value = "notes"
+        self.window.config.revision = 1
+
+        with patch.object(self.search_manager, 'show_search_results') as show:
+            self.search_manager.on_search_changed(entry)
+            self.search_manager.on_search_changed(entry)
+            self.assertEqual(show.call_count, 1)
+
+            # Saved config changes re-run the same search
+            self.window.config.revision = 2
+            self.search_manager.on_search_changed(entry)
+            self.assertEqual(show.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()